@@ -1,9 +1,13 @@
 from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.orm import selectinload
 from functools import wraps
 import os
 import logging
+import traceback
 from datetime import datetime
+from types import MappingProxyType
 
 # 导入配置和模型
 from config import config, Config
@@ -14,9 +18,19 @@ from services.auth_service import AuthService
 from services.rclone_service import RcloneService
 from services.config_service import ConfigService
 
+class JSONProvider(DefaultJSONProvider):
+    """JSON序列化，额外支持只读映射（MappingProxyType）"""
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, MappingProxyType):
+            return dict(o)
+        return DefaultJSONProvider.default(o)
+
 def create_app(config_name='default'):
     """应用工厂函数"""
     app = Flask(__name__)
+    app.json = JSONProvider(app)
     app.config.from_object(config[config_name])
     
     # 初始化配置
@@ -62,14 +76,17 @@ def create_app(config_name='default'):
             # 获取最近的备份日志
             recent_logs = BackupLog.query.order_by(BackupLog.start_time.desc()).limit(10).all()
             
-            # 获取今日备份统计
+            # 获取今日备份统计（按状态分组计数，不加载日志记录）
             today = datetime.now().date()
-            today_logs = BackupLog.query.filter(
-                db.func.date(BackupLog.start_time) == today
-            ).all()
+            today_counts = dict(
+                db.session.query(BackupLog.status, db.func.count(BackupLog.id))
+                .filter(db.func.date(BackupLog.start_time) == today)
+                .group_by(BackupLog.status)
+                .all()
+            )
             
-            today_success = len([log for log in today_logs if log.status == 'success'])
-            today_failed = len([log for log in today_logs if log.status == 'failed'])
+            today_success = today_counts.get('success', 0)
+            today_failed = today_counts.get('failed', 0)
             
             return render_template('dashboard.html',
                                  total_tasks=total_tasks,
@@ -131,8 +148,9 @@ def create_app(config_name='default'):
         storage_types = rclone_service.get_supported_types()
 
         # 获取模块化的模板和类型信息
-        config_templates = TemplateLoader.get_storage_config_templates()
-        storage_type_info = TemplateLoader.get_storage_type_info()
+        storage_type_data = TemplateLoader.get_all()
+        config_templates = storage_type_data['templates']
+        storage_type_info = storage_type_data['info']
 
         return render_template('storage_configs_modular.html',
                              configs=configs,
@@ -487,7 +505,8 @@ def create_app(config_name='default'):
     @login_required
     def backup_tasks():
         """备份任务页面"""
-        tasks = BackupTask.query.all()
+        # 页面需要每个任务的最新日志和成功率，一次批量加载所有任务的日志，避免逐个任务查询
+        tasks = BackupTask.query.options(selectinload(BackupTask.backup_logs)).all()
         storage_configs = StorageConfig.query.filter_by(is_active=True).all()
         return render_template('backup_tasks.html',
                              tasks=tasks,
@@ -957,9 +976,11 @@ def create_app(config_name='default'):
             from services.scheduler_service import scheduler_service, _app_instance
             from datetime import datetime
 
+            scheduler = scheduler_service.scheduler
+
             status_info = {
                 'current_time': datetime.now(),
-                'scheduler_exists': scheduler_service.scheduler is not None,
+                'scheduler_exists': scheduler is not None,
                 'scheduler_running': False,
                 'app_instance_set': _app_instance is not None,
                 'jobs': [],
@@ -967,12 +988,16 @@ def create_app(config_name='default'):
                 'error': None
             }
 
-            if scheduler_service.scheduler:
-                status_info['scheduler_running'] = scheduler_service.scheduler.running
+            # 调度器中已有的作业ID，用于下面逐个任务判断，避免每个任务各查询一次作业存储
+            job_ids = set()
+
+            if scheduler:
+                status_info['scheduler_running'] = scheduler.running
 
                 # 获取作业信息
-                jobs = scheduler_service.scheduler.get_jobs()
+                jobs = scheduler.get_jobs()
                 for job in jobs:
+                    job_ids.add(job.id)
                     status_info['jobs'].append({
                         'id': job.id,
                         'name': job.name,
@@ -981,16 +1006,17 @@ def create_app(config_name='default'):
                         'func_name': job.func.__name__ if hasattr(job.func, '__name__') else str(job.func)
                     })
 
-            # 获取活跃任务
-            active_tasks = BackupTask.query.filter_by(is_active=True).all()
-            for task in active_tasks:
+            # 获取活跃任务（只查询需要的列，不加载完整的ORM对象）
+            active_tasks = BackupTask.query.filter_by(is_active=True).with_entities(
+                BackupTask.id, BackupTask.name, BackupTask.cron_expression, BackupTask.next_run_at
+            ).all()
+            for task_id, name, cron_expression, next_run_at in active_tasks:
                 status_info['active_tasks'].append({
-                    'id': task.id,
-                    'name': task.name,
-                    'cron_expression': task.cron_expression,
-                    'next_run_at': task.next_run_at,
-                    'has_scheduler_job': scheduler_service.scheduler and
-                                       scheduler_service.scheduler.get_job(f"backup_task_{task.id}") is not None
+                    'id': task_id,
+                    'name': name,
+                    'cron_expression': cron_expression,
+                    'next_run_at': next_run_at,
+                    'has_scheduler_job': f"backup_task_{task_id}" in job_ids
                 })
 
             return jsonify(status_info)
@@ -1253,8 +1279,6 @@ def create_app(config_name='default'):
 
                 # 获取rclone配置内容
                 try:
-                    from services.rclone_service import RcloneService
-                    rclone_service = RcloneService()
                     rclone_config = rclone_service.get_config_section(config.rclone_config_name)
                     if rclone_config:
                         config_data['rclone_config'] = rclone_config  # 保存完整配置，稍后统一加密
@@ -1360,7 +1384,6 @@ def create_app(config_name='default'):
         try:
             import json
             from services.encryption_service import EncryptionService
-            from services.rclone_service import RcloneService
 
             # 检查文件上传
             if 'import_file' not in request.files:
@@ -1402,7 +1425,6 @@ def create_app(config_name='default'):
                 return redirect(url_for('import_system_data'))
 
             encryption_service = EncryptionService()
-            rclone_service = RcloneService()
 
             # 解密完整数据
             success, decrypted_data, error = encryption_service.decrypt_data(encrypted_data_str, decryption_password)
@@ -1729,7 +1751,6 @@ def init_database(app):
 
         except Exception as e:
             print(f"数据库初始化失败: {e}")
-            import traceback
             traceback.print_exc()
             raise
 
@@ -37,6 +37,20 @@ class Config:
         RCLONE_BINARY = os.environ.get('RCLONE_BINARY') or 'rclone'
         RCLONE_CONTAINER_NAME = None
 
+    # rclone rcd远程控制地址（如 http://rclone-service:5572），设置后通过rc API执行操作而不是每次启动rclone进程
+    RCLONE_RC_URL = os.environ.get('RCLONE_RC_URL') or None
+    RCLONE_RC_USER = os.environ.get('RCLONE_RC_USER') or None
+    RCLONE_RC_PASS = os.environ.get('RCLONE_RC_PASS') or None
+
+    # rclone传输调优参数（上传/下载时使用）
+    RCLONE_TRANSFERS = int(os.environ.get('RCLONE_TRANSFERS') or 16)
+    RCLONE_MT_STREAMS = int(os.environ.get('RCLONE_MT_STREAMS') or 8)
+    RCLONE_MT_BUFFER = os.environ.get('RCLONE_MT_BUFFER') or '128k'
+    RCLONE_BUFFER_SIZE = os.environ.get('RCLONE_BUFFER_SIZE') or '16M'
+
+    # 写入rclone配置文件后是否fsync（保证断电后替换的文件内容完整；配置写入不频繁，默认开启）
+    RCLONE_CONFIG_FSYNC = os.environ.get('RCLONE_CONFIG_FSYNC', 'true').lower() == 'true'
+
     # 备份配置 - 使用相对路径
     BACKUP_TEMP_DIR = 'data/temp'
     MAX_BACKUP_SIZE = 10 * 1024 * 1024 * 1024  # 10GB
@@ -1,18 +1,16 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
+from zoneinfo import ZoneInfo
 from werkzeug.security import generate_password_hash, check_password_hash
 
 db = SQLAlchemy()
 
+# 本地时区对象只创建一次，各处获取本地时间时共用
+LOCAL_TZ = ZoneInfo('Asia/Shanghai')
+
 def get_local_time():
     """获取本地时间（Asia/Shanghai时区）"""
-    try:
-        import pytz
-        local_tz = pytz.timezone('Asia/Shanghai')
-        local_time = datetime.now(local_tz)
-        return local_time.replace(tzinfo=None)
-    except Exception:
-        return datetime.now()
+    return datetime.now(LOCAL_TZ).replace(tzinfo=None)
 
 class User(db.Model):
     """用户模型"""
@@ -6,7 +6,7 @@ RClone备份Web系统启动脚本
 import os
 import sys
 import logging
-from app import create_app, init_database
+import traceback
 
 def check_rclone():
     """检查rclone是否可用"""
@@ -83,16 +83,13 @@ def init_scheduler(app):
     except Exception as e:
         print(f"✗ 调度器初始化失败: {e}")
         app.logger.error(f"Failed to initialize scheduler: {e}")
-        import traceback
         app.logger.error(traceback.format_exc())
         # 调度器失败不应该阻止应用启动
         print("⚠ 调度器初始化失败，但应用将继续启动")
 
 def main():
     """主函数"""
-    print("=" * 50)
-    print("RClone备份Web系统")
-    print("=" * 50)
+    sys.stdout.write("\n".join(["=" * 50, "RClone备份Web系统", "=" * 50]) + "\n")
 
     # 检查Python版本
     if sys.version_info < (3, 7):
@@ -103,9 +100,14 @@ def main():
     # 获取配置
     config_name = os.environ.get('FLASK_ENV', 'development')
     print(f"✓ 运行模式: {config_name}")
+    debug = config_name == 'development'
+
+    # 开发模式下Flask重载器的父进程只负责监视文件并重启子进程，
+    # rclone检查和数据库初始化交给实际提供服务的子进程完成
+    reloader_parent = debug and os.environ.get('WERKZEUG_RUN_MAIN') != 'true'
 
     # 检查rclone（开发模式下可跳过）
-    if not check_rclone():
+    if not reloader_parent and not check_rclone():
         if config_name == 'development':
             print("⚠ 开发模式：rclone未安装，部分功能可能不可用")
         else:
@@ -115,18 +117,20 @@ def main():
             print("  或使用包管理器: apt install rclone / brew install rclone")
             sys.exit(1)
 
-    # 创建应用
+    # 创建应用（延迟导入，版本检查和rclone检查失败时不必加载Flask及各服务模块）
+    from app import create_app, init_database
     app = create_app(config_name)
 
     # 初始化数据库
-    print("✓ 初始化数据库...")
-    try:
-        init_database(app)
-        print("✓ 数据库初始化完成")
-    except Exception as e:
-        print(f"✗ 数据库初始化失败: {e}")
-        print("请检查data目录权限或手动创建data目录")
-        sys.exit(1)
+    if not reloader_parent:
+        print("✓ 初始化数据库...")
+        try:
+            init_database(app)
+            print("✓ 数据库初始化完成")
+        except Exception as e:
+            print(f"✗ 数据库初始化失败: {e}")
+            print("请检查data目录权限或手动创建data目录")
+            sys.exit(1)
 
     # 初始化调度器
     init_scheduler(app)
@@ -134,13 +138,17 @@ def main():
     # 启动信息
     host = os.environ.get('HOST', '0.0.0.0')
     port = int(os.environ.get('PORT', 5000))
-    debug = config_name == 'development'
 
-    print(f"✓ 服务器启动中...")
-    print(f"  地址: http://{host}:{port}")
-    print(f"  默认用户: admin")
-    print(f"  默认密码: admin123")
-    print("=" * 50)
+    # 启动信息一次性写出并刷新，避免逐行写入控制台/容器日志
+    banner = "\n".join([
+        "✓ 服务器启动中...",
+        f"  地址: http://{host}:{port}",
+        "  默认用户: admin",
+        "  默认密码: admin123",
+        "=" * 50,
+    ])
+    sys.stdout.write(banner + "\n")
+    sys.stdout.flush()
 
     try:
         app.run(host=host, port=port, debug=debug)
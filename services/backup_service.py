@@ -16,7 +16,7 @@ from cryptography.fernet import Fernet
 import base64
 import hashlib
 
-from models import db, BackupTask, BackupLog, StorageConfig
+from models import db, BackupTask, BackupLog, StorageConfig, LOCAL_TZ, get_local_time
 from services.rclone_service import RcloneService
 from config import Config
 
@@ -128,10 +128,7 @@ class BackupService:
             task_ids_to_restart = set()
 
             # 获取当前时间
-            from datetime import datetime
-            import pytz
-            local_tz = pytz.timezone('Asia/Shanghai')
-            current_time = datetime.now(local_tz).replace(tzinfo=None)
+            current_time = get_local_time()
 
             for log in running_logs:
                 try:
@@ -276,8 +273,8 @@ class BackupService:
             self.logger.error(f"Failed to create backup task: {e}")
             return False, f"创建备份任务失败: {str(e)}", None
     
-    def run_backup_task(self, task_id: int, manual: bool = False) -> Tuple[bool, str]:
-        """启动备份任务（异步执行）"""
+    def run_backup_task(self, task_id: int, manual: bool = False, wait: bool = False) -> Tuple[bool, str]:
+        """启动备份任务（默认异步执行；wait为True时在当前线程中执行，备份结束后才返回）"""
         try:
             task = BackupTask.query.get(task_id)
             if not task:
@@ -295,13 +292,18 @@ class BackupService:
             if running_log:
                 return False, "备份任务正在运行中"
 
-            # 启动异步备份任务
             import threading
             from flask import current_app
 
             # 获取当前应用实例，传递给异步线程
             app = current_app._get_current_object()
 
+            if wait:
+                # 备份耗时较长，执行前先释放当前会话，避免整个备份期间占用数据库连接和事务
+                db.session.remove()
+                return self._execute_backup_task_async(app, task_id, manual)
+
+            # 启动异步备份任务
             backup_thread = threading.Thread(
                 target=self._execute_backup_task_async,
                 args=(app, task_id, manual),
@@ -315,8 +317,8 @@ class BackupService:
             self.logger.error(f"Failed to start backup task {task_id}: {e}")
             return False, f"启动备份任务失败: {str(e)}"
 
-    def _execute_backup_task_async(self, app, task_id: int, manual: bool = False):
-        """异步执行备份任务的实际逻辑"""
+    def _execute_backup_task_async(self, app, task_id: int, manual: bool = False) -> Tuple[bool, str]:
+        """异步执行备份任务的实际逻辑，返回 (是否全部成功, 结果消息)"""
         with app.app_context():
             try:
                 self.logger.info(f"异步备份任务开始执行 - 任务ID: {task_id}, 手动执行: {manual}")
@@ -324,7 +326,7 @@ class BackupService:
                 task = BackupTask.query.get(task_id)
                 if not task:
                     self.logger.error(f"Backup task {task_id} not found")
-                    return
+                    return False, "备份任务不存在"
 
                 self.logger.info(f"Starting backup task: {task.name} (ID: {task_id})")
                 self.logger.debug(f"任务配置 - 源路径: {task.source_path}, 压缩: {task.compression_enabled}, "
@@ -348,7 +350,7 @@ class BackupService:
 
                 if not storage_configs:
                     self.logger.error(f"Task {task_id} has no storage configurations")
-                    return
+                    return False, "备份任务没有存储配置"
 
                 self.logger.info(f"找到 {len(storage_configs)} 个存储配置")
                 # 执行备份到所有存储配置
@@ -412,6 +414,7 @@ class BackupService:
                 final_message = "; ".join(all_messages)
                 self.logger.info(f"Backup task {task.name} completed. Overall success: {all_success}")
                 self.logger.info(f"备份任务完全结束 - 任务ID: {task_id}")
+                return all_success, final_message
 
             except Exception as e:
                 self.logger.error(f"Failed to execute backup task {task_id}: {e}", exc_info=True)
@@ -427,6 +430,7 @@ class BackupService:
                 except Exception as commit_error:
                     self.logger.error(f"Failed to update failed logs: {commit_error}")
                     db.session.rollback()
+                return False, f"备份任务执行失败: {str(e)}"
     
     def _execute_backup_to_storage(self, task: BackupTask, log: BackupLog, storage_config, remote_path: str) -> Tuple[bool, str]:
         """执行具体的备份操作到指定存储配置"""
@@ -706,7 +710,6 @@ class BackupService:
         """计算下次运行时间"""
         try:
             from apscheduler.triggers.cron import CronTrigger
-            import pytz
 
             # 解析Cron表达式
             cron_parts = cron_expression.split()
@@ -723,11 +726,11 @@ class BackupService:
                 day=day,
                 month=month,
                 day_of_week=day_of_week,
-                timezone=pytz.timezone('Asia/Shanghai')
+                timezone=LOCAL_TZ
             )
 
             # 计算下次运行时间
-            now = datetime.now(pytz.timezone('Asia/Shanghai'))
+            now = datetime.now(LOCAL_TZ)
             next_run = trigger.get_next_fire_time(None, now)
 
             if next_run:
@@ -741,19 +744,8 @@ class BackupService:
             return None
 
     def _get_local_time(self) -> datetime:
-        """获取本地时间（Asia/Shanghai时区）"""
-        try:
-            import pytz
-
-            # 获取Asia/Shanghai时区的当前时间
-            local_tz = pytz.timezone('Asia/Shanghai')
-            local_time = datetime.now(local_tz)
-            # 返回无时区信息的本地时间，用于数据库存储
-            return local_time.replace(tzinfo=None)
-        except Exception as e:
-            self.logger.warning(f"Failed to get local time, using system time: {e}")
-            # 如果获取本地时间失败，使用系统时间
-            return datetime.now()
+        """获取本地时间（Asia/Shanghai时区），返回无时区信息的时间用于数据库存储"""
+        return get_local_time()
     
     def update_backup_task(self, task_id: int, task_data: Dict, storage_configs_data: List[Dict] = None) -> Tuple[bool, str, Optional[BackupTask]]:
         """更新备份任务"""
@@ -897,74 +889,92 @@ class BackupService:
             self.logger.error(f"Failed to delete backup task: {e}")
             return False, f"删除备份任务失败: {str(e)}"
 
-    def _cleanup_old_backups(self, task: BackupTask):
-        """清理旧备份文件，保留指定数量的最新备份"""
-        try:
-            # 获取成功的备份日志，按时间倒序排列
-            successful_logs = BackupLog.query.filter_by(
-                task_id=task.id,
-                status='success'
-            ).order_by(BackupLog.start_time.desc()).all()
+    def _get_expired_backup_logs(self, task: BackupTask) -> List[BackupLog]:
+        """获取超出保留数量的成功备份日志（按时间倒序，保留最新的retention_count个）"""
+        successful_logs = BackupLog.query.filter_by(
+            task_id=task.id,
+            status='success'
+        ).order_by(BackupLog.start_time.desc()).all()
+        return successful_logs[task.retention_count:]
 
-            # 如果备份数量超过保留数量，删除多余的备份
-            if len(successful_logs) > task.retention_count:
-                logs_to_delete = successful_logs[task.retention_count:]
+    def _delete_expired_backup_files(self, task: BackupTask, logs_to_delete: List[BackupLog]) -> List[int]:
+        """
+        删除过期日志对应的远程备份文件，不修改数据库，可在工作线程中调用
 
-                for log in logs_to_delete:
-                    try:
-                        # 构建远程文件路径
-                        timestamp = log.start_time.strftime('%Y%m%d_%H%M%S')
-
-                        # 尝试不同的文件名格式
-                        possible_extensions = []
-                        if task.compression_enabled:
-                            if task.compression_type == 'tar.gz':
-                                possible_extensions.append('.tar.gz')
-                            elif task.compression_type == 'zip':
-                                possible_extensions.append('.zip')
-                        else:
-                            # 不压缩时，需要根据源文件确定扩展名
-                            if os.path.isfile(task.source_path):
-                                _, ext = os.path.splitext(task.source_path)
-                                possible_extensions.append(ext)
-
-                        if task.encryption_enabled:
-                            possible_extensions = [ext + '.encrypted' for ext in possible_extensions]
-
-                        # 尝试删除远程文件
-                        deleted = False
-                        for ext in possible_extensions:
-                            remote_file_name = f"{task.name}_{timestamp}{ext}"
-                            # 确保路径格式与上传时一致
-                            remote_dir_path = task.remote_path.rstrip('/')
-                            remote_file_path = f"{remote_dir_path}/{remote_file_name}"
-
-                            success, message = self._delete_remote_file(
-                                remote_file_path,
-                                task.storage_config.rclone_config_name
-                            )
+        Returns:
+            list: 已处理、需要删除记录的日志ID
+        """
+        handled_log_ids = []
 
-                            if success:
-                                deleted = True
-                                self.logger.info(f"Deleted old backup file: {remote_file_path}")
-                                break
+        for log in logs_to_delete:
+            try:
+                # 构建远程文件路径
+                timestamp = log.start_time.strftime('%Y%m%d_%H%M%S')
+
+                # 尝试不同的文件名格式
+                possible_extensions = []
+                if task.compression_enabled:
+                    if task.compression_type == 'tar.gz':
+                        possible_extensions.append('.tar.gz')
+                    elif task.compression_type == 'zip':
+                        possible_extensions.append('.zip')
+                else:
+                    # 不压缩时，需要根据源文件确定扩展名
+                    if os.path.isfile(task.source_path):
+                        _, ext = os.path.splitext(task.source_path)
+                        possible_extensions.append(ext)
+
+                if task.encryption_enabled:
+                    possible_extensions = [ext + '.encrypted' for ext in possible_extensions]
+
+                # 尝试删除远程文件
+                deleted = False
+                for ext in possible_extensions:
+                    remote_file_name = f"{task.name}_{timestamp}{ext}"
+                    # 确保路径格式与上传时一致
+                    remote_dir_path = task.remote_path.rstrip('/')
+                    remote_file_path = f"{remote_dir_path}/{remote_file_name}"
+
+                    success, message = self._delete_remote_file(
+                        remote_file_path,
+                        task.storage_config.rclone_config_name
+                    )
 
-                        if not deleted:
-                            self.logger.warning(f"Could not delete old backup for log {log.id}")
+                    if success:
+                        deleted = True
+                        self.logger.info(f"Deleted old backup file: {remote_file_path}")
+                        break
 
-                        # 删除备份日志记录
-                        db.session.delete(log)
+                if not deleted:
+                    self.logger.warning(f"Could not delete old backup for log {log.id}")
 
-                    except Exception as e:
-                        self.logger.error(f"Error deleting old backup for log {log.id}: {e}")
-                        continue
+                # 远程文件无论是否删除成功，日志记录都随后删除
+                handled_log_ids.append(log.id)
+
+            except Exception as e:
+                self.logger.error(f"Error deleting old backup for log {log.id}: {e}")
+                continue
 
-                # 提交数据库更改
+        return handled_log_ids
+
+    def _cleanup_old_backups(self, task: BackupTask):
+        """清理旧备份文件，保留指定数量的最新备份"""
+        try:
+            logs_to_delete = self._get_expired_backup_logs(task)
+            if not logs_to_delete:
+                return
+
+            log_ids = self._delete_expired_backup_files(task, logs_to_delete)
+
+            # 删除备份日志记录并提交数据库更改
+            if log_ids:
+                BackupLog.query.filter(BackupLog.id.in_(log_ids)).delete(synchronize_session=False)
                 db.session.commit()
 
-                self.logger.info(f"Cleaned up {len(logs_to_delete)} old backups for task {task.name}")
+            self.logger.info(f"Cleaned up {len(log_ids)} old backups for task {task.name}")
 
         except Exception as e:
+            db.session.rollback()
             self.logger.error(f"Failed to cleanup old backups for task {task.id}: {e}")
 
     def _cleanup_old_backups_from_remote_storage(self, task: BackupTask, storage_config, remote_path: str):
@@ -0,0 +1,110 @@
+"""
+rclone远程控制（rc）API客户端
+
+通过HTTP调用常驻的 rclone rcd 守护进程，避免每次操作都启动一个rclone进程
+"""
+
+import base64
+import http.client
+import json
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class RcloneRcError(Exception):
+    """rc接口返回错误"""
+
+
+class RcloneRcClient:
+    """rclone rc API客户端，每个线程复用一条到rcd的keep-alive连接"""
+
+    def __init__(self, url: str, user: Optional[str] = None, password: Optional[str] = None):
+        parts = urlsplit(url)
+        self.url = url
+        self._https = parts.scheme == 'https'
+        self._host = parts.hostname or '127.0.0.1'
+        self._port = parts.port or (443 if self._https else 5572)
+        self._headers = {'Content-Type': 'application/json'}
+        if user:
+            token = base64.b64encode(f"{user}:{password or ''}".encode('utf-8')).decode('ascii')
+            self._headers['Authorization'] = f"Basic {token}"
+        self._local = threading.local()
+
+    def _get_connection(self, timeout: float) -> http.client.HTTPConnection:
+        """获取当前线程的连接，不存在时新建"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+            conn = conn_class(self._host, self._port, timeout=timeout)
+            self._local.conn = conn
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    def _reset_connection(self):
+        """关闭当前线程的连接，下次调用时重新建立"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def call(self, method: str, params: Optional[Dict] = None, timeout: float = 60) -> Dict:
+        """
+        调用rc方法
+
+        Args:
+            method: rc方法名，如 operations/list
+            params: 请求参数
+            timeout: 超时时间（秒）
+
+        Returns:
+            dict: rc返回的JSON结果
+
+        Raises:
+            RcloneRcError: rc返回非200状态
+            TimeoutError: 请求超时
+        """
+        body = json.dumps(params or {}).encode('utf-8')
+
+        # keep-alive连接可能已被rcd关闭，此时重连后重试一次
+        for attempt in range(2):
+            conn = self._get_connection(timeout)
+            try:
+                conn.request('POST', f'/{method}', body=body, headers=self._headers)
+                response = conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self._reset_connection()
+                if attempt:
+                    raise
+            except Exception:
+                self._reset_connection()
+                raise
+
+        try:
+            result = json.loads(data) if data else {}
+        except json.JSONDecodeError:
+            result = {'error': data.decode('utf-8', errors='replace')}
+
+        if response.status != 200:
+            raise RcloneRcError(result.get('error') or f"HTTP {response.status}")
+
+        return result
+
+
+# 按URL共享的客户端实例，RcloneService会被频繁创建，连接需要跨实例复用
+_clients: Dict[str, RcloneRcClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_rc_client(url: str, user: Optional[str] = None, password: Optional[str] = None) -> RcloneRcClient:
+    """获取指定地址的共享rc客户端"""
+    with _clients_lock:
+        client = _clients.get(url)
+        if client is None:
+            client = RcloneRcClient(url, user, password)
+            _clients[url] = client
+        return client
@@ -1,10 +1,66 @@
 import subprocess
 import json
 import os
+import re
+import shlex
+import stat
 import logging
 import tempfile
-from typing import Dict, List, Optional, Tuple
+import time
+import selectors
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
 from config import Config
+from services.rclone_rc_client import RcloneRcError, get_rc_client
+
+# S3兼容服务的endpoint识别表：匹配到的域名 -> rclone provider
+_S3_PROVIDER_RE = re.compile(r'(aliyuncs\.com|r2\.cloudflarestorage\.com)')
+_S3_PROVIDERS = {
+    'aliyuncs.com': 'Alibaba',
+    'r2.cloudflarestorage.com': 'Cloudflare',
+}
+
+# 日志中需要脱敏的字段名片段
+_SENSITIVE_KEY_PARTS = ('pass', 'secret', 'key', 'token')
+
+# 连接测试使用的快速失败参数：远端不可达时尽快返回，而不是走rclone默认的长超时和多次重试
+_CONNECTION_TEST_ARGS = (
+    '--timeout', '10s',
+    '--contimeout', '10s',
+    '--retries', '1',
+    '--low-level-retries', '1',
+)
+
+# rclone命令行参数 -> rc接口 _config 选项名
+_RC_OPTION_NAMES = {
+    '--transfers': 'Transfers',
+    '--multi-thread-streams': 'MultiThreadStreams',
+    '--buffer-size': 'BufferSize',
+    '--timeout': 'Timeout',
+    '--contimeout': 'ConnectTimeout',
+    '--low-level-retries': 'LowLevelRetries',
+}
+
+# 写入配置文件时的缓冲区大小，整个配置通常一次write即可完成
+_CONFIG_WRITE_BUFFER_SIZE = 64 * 1024
+
+# 新建配置文件的权限，与open()创建文件一致（0666去掉umask）；umask只能通过设置来读取，导入时读取一次
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_CONFIG_FILE_MODE = 0o666 & ~_UMASK
+
+# 生成配置段时优先按此顺序输出的字段，其余字段按原顺序排在后面
+_ORDERED_CONFIG_KEYS = ('type', 'provider', 'access_key_id', 'secret_access_key', 'endpoint', 'region')
+_ORDERED_CONFIG_KEY_SET = frozenset(_ORDERED_CONFIG_KEYS)
+
+# 上传/下载失败时保留的rclone输出行数（只保留末尾，避免长时间传输的日志占满内存）
+_OUTPUT_TAIL_LINES = 200
+
+# 配置段头行，如 "[remote]"
+_SECTION_HEADER_RE = re.compile(r'\[([^\]]+)\]\s*$')
+
+# 配置文件中的段头行，如 "[remote]"（按字节匹配，用于定位段的偏移量）
+_SECTION_HEADER_BYTES_RE = re.compile(rb'^[ \t]*\[([^\]\r\n]*)\][ \t\r]*$', re.MULTILINE)
 
 class RcloneService:
     """rclone服务类"""
@@ -15,22 +71,81 @@ class RcloneService:
         self.docker_env = Config.DOCKER_ENV
         self.rclone_container_name = Config.RCLONE_CONTAINER_NAME
         self.logger = logging.getLogger(__name__)
+        # 所有配置段共用一个rclone标准配置文件，路径只计算一次
+        self._config_path = os.path.join(self.config_dir, 'rclone.conf')
+        # 已确认存在的配置文件路径缓存，在create/delete时失效
+        # 只缓存存在的结果，避免其他实例创建配置后这里仍返回不存在
+        self._existing_config_paths = set()
 
         # 确保配置目录存在
         os.makedirs(self.config_dir, exist_ok=True)
 
+        # 所有rclone命令共用的配置文件参数
+        self._config_args = ('--config', self.get_config_path())
+
+        # 上传/下载共用的传输调优参数
+        self._transfer_args = (
+            '--transfers', str(Config.RCLONE_TRANSFERS),
+            '--multi-thread-streams', str(Config.RCLONE_MT_STREAMS),
+            '--multi-thread-buffer-size', Config.RCLONE_MT_BUFFER,
+            '--buffer-size', Config.RCLONE_BUFFER_SIZE,
+        )
+
+        # 配置了rcd地址时通过rc API执行操作，连接在所有实例间共享
+        self.rc_client = None
+        if Config.RCLONE_RC_URL:
+            self.rc_client = get_rc_client(Config.RCLONE_RC_URL, Config.RCLONE_RC_USER, Config.RCLONE_RC_PASS)
+
         self.logger.info(f"RcloneService initialized - Docker环境: {self.docker_env}")
-        if self.docker_env:
+        if self.rc_client:
+            self.logger.info(f"rclone rc地址: {Config.RCLONE_RC_URL}")
+        elif self.docker_env:
             self.logger.info(f"rclone容器名称: {self.rclone_container_name}")
         else:
             self.logger.info(f"rclone二进制文件: {self.rclone_binary}")
     
     def get_config_path(self, config_name: str = None) -> str:
         """获取配置文件路径"""
-        # 使用rclone标准配置文件名
-        return os.path.join(self.config_dir, 'rclone.conf')
+        # 使用rclone标准配置文件名，所有配置段共用同一文件
+        return self._config_path
+
+    def _config_path_exists(self, config_path: str = None) -> bool:
+        """检查配置文件是否存在，结果按路径缓存以避免重复stat"""
+        config_path = config_path or self.get_config_path()
+        if config_path in self._existing_config_paths:
+            return True
+        if os.path.exists(config_path):
+            self._existing_config_paths.add(config_path)
+            return True
+        return False
 
-    def _build_rclone_command(self, rclone_args: List[str]) -> List[str]:
+    def _invalidate_config_cache(self):
+        """配置文件被修改后清除缓存"""
+        self._existing_config_paths.clear()
+        if self.rc_client:
+            # rcd会缓存已创建的远程存储对象，配置变更后需要清除
+            try:
+                self.rc_client.call('fscache/clear', timeout=10)
+            except Exception as e:
+                self.logger.warning(f"Failed to clear rclone rc fs cache: {e}")
+
+    def _rc_options(self, args: Sequence[str]) -> Dict:
+        """将rclone命令行调优参数转换为rc接口的 _config 选项"""
+        options = {}
+        for flag, value in zip(args[::2], args[1::2]):
+            name = _RC_OPTION_NAMES.get(flag)
+            if name:
+                options[name] = int(value) if value.isdigit() else value
+        return options
+
+    def _rc_fs(self, config_name: str, remote_path: str = '') -> str:
+        """构建rc接口使用的远程存储路径，S3类型附加no_check_bucket避免检查或创建bucket"""
+        section = self.get_config_section(config_name) or {}
+        if section.get('type') == 's3':
+            return f'{config_name},no_check_bucket=true:{remote_path}'
+        return f'{config_name}:{remote_path}'
+
+    def _build_rclone_command(self, rclone_args: Sequence[str]) -> List[str]:
         """构建rclone命令，根据环境选择直接调用或Docker调用"""
         if self.docker_env:
             # Docker环境：通过docker exec调用rclone容器
@@ -61,6 +176,125 @@ class RcloneService:
 
         return cmd
 
+    def _log_command(self, message: str, cmd: List[str]):
+        """记录将要执行的命令，仅在INFO级别启用时才拼接命令行"""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"{message}: {shlex.join(cmd)}")
+
+    def _run_with_output_tail(self, cmd: List[str], timeout: float) -> Tuple[int, str, str]:
+        """
+        执行长时间运行的rclone命令，持续读取stdout和stderr并各自只保留最后若干行
+
+        Returns:
+            Tuple[int, str, str]: (返回码, stdout末尾内容, stderr末尾内容)
+
+        Raises:
+            subprocess.TimeoutExpired: 超时（进程已被终止）
+        """
+        tails = (deque(maxlen=_OUTPUT_TAIL_LINES), deque(maxlen=_OUTPUT_TAIL_LINES))
+
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            if os.name == 'nt':
+                # Windows上selectors不支持管道，退回communicate
+                finished = self._communicate_output(proc, timeout, tails)
+            else:
+                finished = self._drain_output(proc, timeout, tails)
+            if finished:
+                return proc.returncode, self._join_output(tails[0]), self._join_output(tails[1])
+        finally:
+            # 超时或读取过程中出现异常时，不留下仍在运行的rclone进程
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
+
+        raise subprocess.TimeoutExpired(
+            cmd, timeout,
+            output=self._join_output(tails[0]),
+            stderr=self._join_output(tails[1])
+        )
+
+    def _drain_output(self, proc: subprocess.Popen, timeout: float, tails: Tuple[deque, deque]) -> bool:
+        """
+        通过selector同时读取进程的stdout和stderr直到进程结束，两个管道都持续读取，
+        任何一个写满都不会阻塞rclone；输出行分别追加到tails
+
+        Returns:
+            bool: 进程是否在超时前结束
+        """
+        deadline = time.monotonic() + timeout
+        # 管道fd -> [输出行队列, 未以换行结尾的剩余内容]
+        streams = {
+            proc.stdout.fileno(): [tails[0], b''],
+            proc.stderr.fileno(): [tails[1], b'']
+        }
+        try:
+            with selectors.DefaultSelector() as selector:
+                for fd in streams:
+                    selector.register(fd, selectors.EVENT_READ)
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+
+                    for key, _ in selector.select(remaining):
+                        stream = streams[key.fd]
+                        chunk = os.read(key.fd, 65536)
+                        if not chunk:
+                            selector.unregister(key.fd)
+                            continue
+                        lines = (stream[1] + chunk).split(b'\n')
+                        stream[1] = lines.pop()
+                        stream[0].extend(lines)
+                        self._log_output_lines(lines)
+        finally:
+            for tail, pending in streams.values():
+                if pending:
+                    tail.append(pending)
+
+        # 输出已读完，进程即将退出；剩余时间内仍未退出按超时处理
+        try:
+            proc.wait(timeout=max(deadline - time.monotonic(), 1))
+        except subprocess.TimeoutExpired:
+            return False
+        return True
+
+    def _communicate_output(self, proc: subprocess.Popen, timeout: float, tails: Tuple[deque, deque]) -> bool:
+        """
+        通过communicate读取进程的全部stdout和stderr，输出行分别追加到tails（不支持selector管道的平台使用）
+
+        Returns:
+            bool: 进程是否在超时前结束
+        """
+        try:
+            outputs = proc.communicate(timeout=timeout)
+            finished = True
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            outputs = proc.communicate()
+            finished = False
+
+        for tail, output in zip(tails, outputs):
+            lines = output.split(b'\n')
+            if not lines[-1]:
+                lines.pop()
+            tail.extend(lines)
+            self._log_output_lines(lines)
+        return finished
+
+    def _log_output_lines(self, lines: List[bytes]):
+        """在DEBUG级别逐行记录rclone输出"""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for line in lines:
+                self.logger.debug(f"rclone: {line.decode('utf-8', errors='replace').rstrip()}")
+
+    @staticmethod
+    def _join_output(lines) -> str:
+        """拼接保留的输出行"""
+        return b'\n'.join(lines).decode('utf-8', errors='replace')
+
     def _is_temp_file_path(self, path: str) -> bool:
         """判断是否为临时文件路径"""
         # 处理绝对路径
@@ -83,13 +317,8 @@ class RcloneService:
             self.logger.info(f"Config data keys: {list(config_data.keys())}")
 
             # 记录敏感信息的掩码版本
-            masked_config = {}
-            for key, value in config_data.items():
-                if any(sensitive in key.lower() for sensitive in ['password', 'secret', 'key', 'token']):
-                    masked_config[key] = f"***{value[-4:] if len(str(value)) > 4 else '***'}"
-                else:
-                    masked_config[key] = value
-            self.logger.info(f"Config data (masked): {masked_config}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Config data (masked): %s", self._mask_mapping(config_data))
 
             # 根据存储类型生成配置内容
             config_content = self._generate_config_content(name, storage_type, config_data)
@@ -100,37 +329,42 @@ class RcloneService:
             self.logger.info(f"Generated config content (length: {len(config_content)} chars)")
             # 记录配置内容的掩码版本（仅在调试模式下）
             if self.logger.isEnabledFor(logging.DEBUG):
-                masked_content = config_content
-                for key, value in config_data.items():
-                    if any(sensitive in key.lower() for sensitive in ['password', 'secret', 'key', 'token']):
-                        if str(value) in masked_content:
-                            masked_content = masked_content.replace(str(value), f"***{str(value)[-4:] if len(str(value)) > 4 else '***'}")
-                self.logger.debug(f"Generated config content (masked):\n{masked_content}")
+                self.logger.debug("Generated config content (masked):\n%s", self._mask_config_text(config_content))
 
             # 读取现有配置文件
-            existing_config = ""
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
+            existing_config = b""
+            if self._config_path_exists(config_path):
+                with open(config_path, 'rb') as f:
                     existing_config = f.read()
-                self.logger.info(f"Existing config file size: {len(existing_config)} chars")
+                self.logger.info(f"Existing config file size: {len(existing_config)} bytes")
             else:
                 self.logger.info("No existing config file found, creating new one")
 
-            # 删除同名配置（如果存在）
-            original_size = len(existing_config)
-            existing_config = self._remove_config_section(existing_config, name)
-            if len(existing_config) != original_size:
-                self.logger.info(f"Removed existing config section '{name}', size changed from {original_size} to {len(existing_config)} chars")
-
-            # 追加新配置
-            new_config = existing_config + "\n" + config_content if existing_config else config_content
-
-            # 写入配置文件
-            with open(config_path, 'w', encoding='utf-8') as f:
-                f.write(new_config)
+            spans = self._find_section_spans(existing_config, name) if existing_config else []
+            if existing_config.strip() and not spans:
+                # 新配置段：直接追加到文件末尾，无需重写整个文件
+                with open(config_path, 'a', encoding='utf-8') as f:
+                    f.write("\n" + config_content)
+                    self._sync_config_file(f)
+                self.logger.info(f"Appended new config section '{name}' ({len(config_content)} chars)")
+            else:
+                # 删除同名配置（如果存在）后追加新配置
+                if spans:
+                    original_size = len(existing_config)
+                    existing_config = self._remove_section_spans(existing_config, spans)
+                    self.logger.info(f"Removed existing config section '{name}', size changed from {original_size} to {len(existing_config)} bytes")
+
+                # 去掉剩余内容末尾的空行，与新配置段之间只保留一个空行，反复编辑最后一段时空行不会累积
+                new_config = config_content.encode('utf-8')
+                existing_config = existing_config.rstrip()
+                if existing_config:
+                    new_config = existing_config + b"\n\n" + new_config
+
+                # 写入配置文件
+                self._write_config_file(config_path, new_config)
+                self.logger.info(f"Final config file size: {len(new_config)} bytes")
 
             self.logger.info(f"Successfully created rclone config: {name}")
-            self.logger.info(f"Final config file size: {len(new_config)} chars")
 
             # 验证配置文件是否正确写入
             if os.path.exists(config_path):
@@ -146,29 +380,85 @@ class RcloneService:
             self.logger.error(f"Failed to create rclone config {name}: {e}", exc_info=True)
             return False
 
-    def _remove_config_section(self, config_content: str, section_name: str) -> str:
-        """从配置内容中删除指定的配置段"""
-        lines = config_content.split('\n')
-        result_lines = []
-        in_target_section = False
-
-        for line in lines:
-            line = line.strip()
-
-            # 检查是否是配置段开始
-            if line.startswith('[') and line.endswith(']'):
-                section = line[1:-1]
-                if section == section_name:
-                    in_target_section = True
-                    continue  # 跳过这一行
-                else:
-                    in_target_section = False
-
-            # 如果不在目标段中，保留这一行
-            if not in_target_section:
-                result_lines.append(line)
-
-        return '\n'.join(result_lines).strip()
+    @staticmethod
+    def _is_sensitive_key(key: str) -> bool:
+        """判断字段是否为敏感信息（密码、密钥、令牌等）"""
+        key = key.lower()
+        return any(part in key for part in _SENSITIVE_KEY_PARTS)
+
+    @staticmethod
+    def _mask_value(value) -> str:
+        """敏感值只保留末尾4个字符"""
+        value = str(value)
+        return f"***{value[-4:]}" if len(value) > 4 else "******"
+
+    def _mask_mapping(self, data: Dict) -> Dict:
+        """返回敏感字段已脱敏的字典副本，用于日志输出"""
+        return {key: self._mask_value(value) if self._is_sensitive_key(key) else value
+                for key, value in data.items()}
+
+    def _mask_config_text(self, content: str) -> str:
+        """对配置文件文本中的敏感字段值脱敏，用于日志输出"""
+        masked_lines = []
+        for line in content.split('\n'):
+            key, sep, value = line.partition('=')
+            if sep and self._is_sensitive_key(key.strip()) and value.strip():
+                line = f"{key}= {self._mask_value(value.strip())}"
+            masked_lines.append(line)
+        return '\n'.join(masked_lines)
+
+    def _sync_config_file(self, f):
+        """按配置将已写入的内容刷到磁盘，保证os.replace之后文件内容完整"""
+        if Config.RCLONE_CONFIG_FSYNC:
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_config_file(self, config_path: str, content):
+        """写入配置文件：先写临时文件再os.replace原子替换，避免rclone读到写了一半的文件"""
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        with tempfile.NamedTemporaryFile('wb', buffering=_CONFIG_WRITE_BUFFER_SIZE, dir=os.path.dirname(config_path),
+                                         prefix='.rclone.conf.', suffix='.tmp', delete=False) as f:
+            tmp_path = f.name
+            f.write(data)
+            self._sync_config_file(f)
+        try:
+            # NamedTemporaryFile以0600创建，替换前沿用原文件的权限，
+            # 否则以其他用户运行的rclone/rcd容器将无法读取配置
+            try:
+                mode = stat.S_IMODE(os.stat(config_path).st_mode)
+            except FileNotFoundError:
+                mode = _NEW_CONFIG_FILE_MODE
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, config_path)
+        except OSError:
+            os.remove(tmp_path)
+            raise
+        self._invalidate_config_cache()
+
+    def _remove_section_spans(self, content: bytes, spans: List[Tuple[int, int]]) -> bytes:
+        """从配置内容中删除指定字节范围的配置段，其余内容原样保留"""
+        parts = []
+        position = 0
+        for start, end in spans:
+            parts.append(content[position:start])
+            position = end
+        parts.append(content[position:])
+        return b''.join(parts)
+
+    def _find_section_spans(self, content: bytes, section_name: str) -> List[Tuple[int, int]]:
+        """查找指定配置段在文件内容中的字节范围列表 [(start, end), ...]"""
+        target = section_name.encode('utf-8')
+        spans = []
+        start = None
+        for match in _SECTION_HEADER_BYTES_RE.finditer(content):
+            if start is not None:
+                spans.append((start, match.start()))
+                start = None
+            if match.group(1) == target:
+                start = match.start()
+        if start is not None:
+            spans.append((start, len(content)))
+        return spans
 
     def _config_section_exists(self, config_path: str, section_name: str) -> bool:
         """检查配置文件中是否存在指定的配置段"""
@@ -196,175 +486,183 @@ class RcloneService:
                 # 直接使用提供的rclone配置数据
                 config_lines = [f"[{name}]"]
 
-                # 按特定顺序添加配置项以保持一致性
-                ordered_keys = ['type', 'provider', 'access_key_id', 'secret_access_key', 'endpoint', 'region']
-
-                # 首先添加有序的关键字段
-                for key in ordered_keys:
+                # 首先按特定顺序添加关键字段以保持一致性
+                for key in _ORDERED_CONFIG_KEYS:
                     if key in config_data:
                         config_lines.append(f"{key} = {config_data[key]}")
 
-                # 然后添加其他字段
+                # 然后添加其他字段（跳过_开头的内部字段，如配置历史中保存的 _raw_config）
                 for key, value in config_data.items():
-                    if key not in ordered_keys and value is not None and str(value).strip():
+                    if key.startswith('_'):
+                        continue
+                    if key not in _ORDERED_CONFIG_KEY_SET and value is not None and str(value).strip():
                         config_lines.append(f"{key} = {value}")
 
+                if not self._check_config_lines(name, config_lines):
+                    return None
                 return '\n'.join(config_lines)
 
-            # 兼容旧的配置格式 - 保留原有逻辑作为后备
-            if storage_type == 's3':
-                # 支持AWS S3和兼容S3的服务
-                config = f"""[{name}]
-type = s3
-access_key_id = {config_data.get('access_key_id', config_data.get('access_key', ''))}
-secret_access_key = {config_data.get('secret_access_key', config_data.get('secret_key', ''))}
-region = {config_data.get('region', 'us-east-1')}
-"""
-                # 根据endpoint判断provider
-                endpoint = config_data.get('endpoint', '').strip()
-                if endpoint:
-                    if 'aliyuncs.com' in endpoint:
-                        config += f"provider = Alibaba\nendpoint = {endpoint}\n"
-                    elif 'r2.cloudflarestorage.com' in endpoint:
-                        config += f"provider = Cloudflare\nendpoint = {endpoint}\n"
-                    else:
-                        config += f"provider = Other\nendpoint = {endpoint}\n"
-                else:
-                    config += "provider = AWS\n"
-
-                # 添加可选配置
-                if config_data.get('bucket'):
-                    config += f"bucket = {config_data['bucket']}\n"
-                if config_data.get('location_constraint'):
-                    config += f"location_constraint = {config_data['location_constraint']}\n"
-
-                return config
-
-            elif storage_type == 'alibaba_oss':
-                # 阿里云OSS专用配置
-                return f"""[{name}]
-type = s3
-provider = Alibaba
-access_key_id = {config_data.get('access_key_id', config_data.get('access_key', ''))}
-secret_access_key = {config_data.get('secret_access_key', config_data.get('secret_key', ''))}
-endpoint = {config_data['endpoint']}
-region = {config_data.get('region', 'oss-cn-hangzhou')}
-location_constraint = {config_data.get('region', 'oss-cn-hangzhou')}
-"""
-
-            elif storage_type == 'cloudflare_r2':
-                # Cloudflare R2专用配置
-                endpoint = config_data.get('endpoint', '')
-                # 确保endpoint不包含协议前缀（新的验证逻辑已经处理了这个）
-                if endpoint.startswith('https://') or endpoint.startswith('http://'):
-                    endpoint = endpoint.replace('https://', '').replace('http://', '')
-
-                return f"""[{name}]
-type = s3
-provider = Cloudflare
-access_key_id = {config_data.get('access_key_id', config_data.get('access_key', ''))}
-secret_access_key = {config_data.get('secret_access_key', config_data.get('secret_key', ''))}
-endpoint = {endpoint}
-region = auto
-force_path_style = true
-"""
-
-            elif storage_type == 'google_drive':
-                # Google Drive配置
-                config = f"""[{name}]
-type = drive
-"""
-                # 客户端凭据（可选，留空使用rclone默认值）
-                if config_data.get('client_id'):
-                    config += f"client_id = {config_data['client_id']}\n"
-                if config_data.get('client_secret'):
-                    config += f"client_secret = {config_data['client_secret']}\n"
-
-                # 服务账户凭据
-                if config_data.get('service_account_credentials'):
-                    config += f"service_account_credentials = {config_data['service_account_credentials']}\n"
-
-                # 访问范围
-                scope = config_data.get('scope', 'drive')
-                config += f"scope = {scope}\n"
-
-                # 根文件夹ID
-                if config_data.get('root_folder_id'):
-                    config += f"root_folder_id = {config_data['root_folder_id']}\n"
-
-                # 如果有访问令牌（OAuth2授权后获得）
-                if config_data.get('token'):
-                    config += f"token = {config_data['token']}\n"
-
-                return config
-
-            elif storage_type == 'sftp':
-                # SFTP配置
-                config = f"""[{name}]
-type = sftp
-host = {config_data['host']}
-user = {config_data['username']}
-port = {config_data.get('port', 22)}
-"""
-                # 认证方式
-                if config_data.get('password'):
-                    config += f"pass = {config_data['password']}\n"
-
-                if config_data.get('key_file'):
-                    config += f"key_file = {config_data['key_file']}\n"
-
-                if config_data.get('key_pass'):
-                    config += f"key_pass = {config_data['key_pass']}\n"
-
-                # 可选配置
-                if config_data.get('use_insecure_cipher'):
-                    config += f"use_insecure_cipher = {config_data['use_insecure_cipher']}\n"
-
-                if config_data.get('disable_hashcheck'):
-                    config += f"disable_hashcheck = {config_data['disable_hashcheck']}\n"
-
-                return config
-
-            elif storage_type == 'ftp':
-                return f"""[{name}]
-type = ftp
-host = {config_data['host']}
-user = {config_data['username']}
-pass = {config_data['password']}
-port = {config_data.get('port', 21)}
-"""
-            elif storage_type == 'raw_rclone':
-                # 原始rclone配置 - 直接使用用户提供的配置
-                return self._generate_raw_rclone_config(name, config_data)
-
-            else:
+            # 兼容旧的配置格式 - 保留原有逻辑作为后备，按存储类型查表生成
+            generator = self._LEGACY_CONFIG_GENERATORS.get(storage_type)
+            if generator is None:
                 self.logger.error(f"Unsupported storage type: {storage_type}")
                 return None
+
+            parts = generator(self, config_data)
+            parts.insert(0, f"[{name}]")
+            if not self._check_config_lines(name, parts):
+                return None
+            return "\n".join(parts) + "\n"
         except KeyError as e:
             self.logger.error(f"Missing required config parameter: {e}")
             return None
 
-    def _generate_raw_rclone_config(self, name: str, config_data: Dict) -> Optional[str]:
-        """生成原始rclone配置"""
-        try:
-            # 构建配置段
-            config_lines = [f"[{name}]"]
-
-            # 添加所有配置项（除了内部字段）
-            for key, value in config_data.items():
-                if not key.startswith('_'):  # 跳过内部字段如 _raw_config
-                    config_lines.append(f"{key} = {value}")
-
-            return "\n".join(config_lines) + "\n"
-
-        except Exception as e:
-            self.logger.error(f"Failed to generate raw rclone config: {e}")
-            return None
-
-    def get_supported_types(self) -> List[Dict[str, str]]:
-        """获取支持的存储类型 - 从存储类型注册器获取"""
+    def _check_config_lines(self, name: str, lines: List[str]) -> bool:
+        """检查配置行中不含换行符，否则名称或值中的换行会在配置文件中产生额外的行或配置段"""
+        for line in lines:
+            if '\n' in line or '\r' in line:
+                key = line.split(' = ', 1)[0]
+                self.logger.error(f"Config '{name}' contains a line break in '{key}', refusing to write it")
+                return False
+        return True
+
+    def _legacy_s3_lines(self, config_data: Dict) -> List[str]:
+        """旧格式S3配置：支持AWS S3和兼容S3的服务"""
+        parts = [
+            "type = s3",
+            f"access_key_id = {config_data.get('access_key_id', config_data.get('access_key', ''))}",
+            f"secret_access_key = {config_data.get('secret_access_key', config_data.get('secret_key', ''))}",
+            f"region = {config_data.get('region', 'us-east-1')}",
+        ]
+        # 根据endpoint判断provider
+        endpoint = config_data.get('endpoint', '').strip()
+        if endpoint:
+            match = _S3_PROVIDER_RE.search(endpoint)
+            provider = _S3_PROVIDERS[match.group(1)] if match else 'Other'
+            parts.append(f"provider = {provider}")
+            parts.append(f"endpoint = {endpoint}")
+        else:
+            parts.append("provider = AWS")
+
+        # 添加可选配置
+        if config_data.get('bucket'):
+            parts.append(f"bucket = {config_data['bucket']}")
+        if config_data.get('location_constraint'):
+            parts.append(f"location_constraint = {config_data['location_constraint']}")
+        return parts
+
+    def _legacy_alibaba_oss_lines(self, config_data: Dict) -> List[str]:
+        """旧格式阿里云OSS专用配置"""
+        region = config_data.get('region', 'oss-cn-hangzhou')
+        return [
+            "type = s3",
+            "provider = Alibaba",
+            f"access_key_id = {config_data.get('access_key_id', config_data.get('access_key', ''))}",
+            f"secret_access_key = {config_data.get('secret_access_key', config_data.get('secret_key', ''))}",
+            f"endpoint = {config_data['endpoint']}",
+            f"region = {region}",
+            f"location_constraint = {region}",
+        ]
+
+    def _legacy_cloudflare_r2_lines(self, config_data: Dict) -> List[str]:
+        """旧格式Cloudflare R2专用配置"""
+        endpoint = config_data.get('endpoint', '')
+        # 确保endpoint不包含协议前缀（新的验证逻辑已经处理了这个）
+        if endpoint.startswith(('https://', 'http://')):
+            endpoint = endpoint.replace('https://', '').replace('http://', '')
+
+        return [
+            "type = s3",
+            "provider = Cloudflare",
+            f"access_key_id = {config_data.get('access_key_id', config_data.get('access_key', ''))}",
+            f"secret_access_key = {config_data.get('secret_access_key', config_data.get('secret_key', ''))}",
+            f"endpoint = {endpoint}",
+            "region = auto",
+            "force_path_style = true",
+        ]
+
+    def _legacy_google_drive_lines(self, config_data: Dict) -> List[str]:
+        """旧格式Google Drive配置"""
+        parts = ["type = drive"]
+
+        # 客户端凭据（可选，留空使用rclone默认值）
+        if config_data.get('client_id'):
+            parts.append(f"client_id = {config_data['client_id']}")
+        if config_data.get('client_secret'):
+            parts.append(f"client_secret = {config_data['client_secret']}")
+
+        # 服务账户凭据
+        if config_data.get('service_account_credentials'):
+            parts.append(f"service_account_credentials = {config_data['service_account_credentials']}")
+
+        # 访问范围
+        parts.append(f"scope = {config_data.get('scope', 'drive')}")
+
+        # 根文件夹ID
+        if config_data.get('root_folder_id'):
+            parts.append(f"root_folder_id = {config_data['root_folder_id']}")
+
+        # 如果有访问令牌（OAuth2授权后获得）
+        if config_data.get('token'):
+            parts.append(f"token = {config_data['token']}")
+        return parts
+
+    def _legacy_sftp_lines(self, config_data: Dict) -> List[str]:
+        """旧格式SFTP配置"""
+        parts = [
+            "type = sftp",
+            f"host = {config_data['host']}",
+            f"user = {config_data['username']}",
+            f"port = {config_data.get('port', 22)}",
+        ]
+        # 认证方式
+        if config_data.get('password'):
+            parts.append(f"pass = {config_data['password']}")
+
+        if config_data.get('key_file'):
+            parts.append(f"key_file = {config_data['key_file']}")
+
+        if config_data.get('key_pass'):
+            parts.append(f"key_pass = {config_data['key_pass']}")
+
+        # 可选配置
+        if config_data.get('use_insecure_cipher'):
+            parts.append(f"use_insecure_cipher = {config_data['use_insecure_cipher']}")
+
+        if config_data.get('disable_hashcheck'):
+            parts.append(f"disable_hashcheck = {config_data['disable_hashcheck']}")
+        return parts
+
+    def _legacy_ftp_lines(self, config_data: Dict) -> List[str]:
+        """旧格式FTP配置"""
+        return [
+            "type = ftp",
+            f"host = {config_data['host']}",
+            f"user = {config_data['username']}",
+            f"pass = {config_data['password']}",
+            f"port = {config_data.get('port', 21)}",
+        ]
+
+    def _raw_rclone_lines(self, config_data: Dict) -> List[str]:
+        """原始rclone配置 - 直接使用用户提供的配置项（除了内部字段）"""
+        return [f"{key} = {value}" for key, value in config_data.items()
+                if not key.startswith('_')]  # 跳过内部字段如 _raw_config
+
+    # 旧配置格式的存储类型 -> 配置行生成方法
+    _LEGACY_CONFIG_GENERATORS = {
+        's3': _legacy_s3_lines,
+        'alibaba_oss': _legacy_alibaba_oss_lines,
+        'cloudflare_r2': _legacy_cloudflare_r2_lines,
+        'google_drive': _legacy_google_drive_lines,
+        'sftp': _legacy_sftp_lines,
+        'ftp': _legacy_ftp_lines,
+        'raw_rclone': _raw_rclone_lines,
+    }
+
+    def get_supported_types(self) -> Tuple[Tuple[str, str], ...]:
+        """获取支持的存储类型 (value, label) 元组 - 由存储类型注册器缓存"""
         from .storage_types import StorageTypeRegistry
-        return StorageTypeRegistry.get_all_types()
+        return StorageTypeRegistry.get_all_types_compact()
     
     def test_connection(self, config_name: str, test_path: str = None) -> Tuple[bool, str]:
         """测试rclone连接 - 使用真实的备份操作流程进行测试"""
@@ -377,7 +675,7 @@ port = {config_data.get('port', 21)}
             self.logger.info(f"Testing connection for {config_name} with test_path: {test_path}")
 
             config_path = self.get_config_path()
-            if not os.path.exists(config_path):
+            if not self._config_path_exists(config_path):
                 self.logger.error(f"Config file does not exist: {config_path}")
                 return False, "配置文件不存在"
 
@@ -387,14 +685,7 @@ port = {config_data.get('port', 21)}
                 return False, f"配置段 '{config_name}' 不存在"
 
             # 第一步：验证配置格式
-            verify_args = ['config', 'show', config_name, '--config', config_path]
-            verify_cmd = self._build_rclone_command(verify_args)
-
-            self.logger.info(f"Verifying config format: {' '.join(verify_cmd)}")
-            verify_result = subprocess.run(verify_cmd, capture_output=True, text=True, timeout=10)
-
-            if verify_result.returncode != 0:
-                self.logger.error(f"Config verification failed: {verify_result.stderr}")
+            if not self._verify_config_format(config_name):
                 return False, "配置格式验证失败"
 
             self.logger.info(f"Config format verification successful")
@@ -425,7 +716,8 @@ port = {config_data.get('port', 21)}
 
             # 第三步：测试上传
             self.logger.info(f"Testing upload to {config_name}:{remote_test_path}")
-            upload_success, upload_message = self.upload_file(temp_test_file, remote_test_path + test_filename, config_name)
+            upload_success, upload_message = self.upload_file(
+                temp_test_file, remote_test_path + test_filename, config_name, extra_args=_CONNECTION_TEST_ARGS)
 
             if not upload_success:
                 self.logger.error(f"Upload test failed: {upload_message}")
@@ -435,7 +727,8 @@ port = {config_data.get('port', 21)}
 
             # 第四步：测试列出文件
             self.logger.info(f"Testing list files in {remote_test_path}")
-            list_success, files, list_message = self.list_files(remote_test_path, config_name)
+            list_success, files, list_message = self.list_files(
+                remote_test_path, config_name, extra_args=_CONNECTION_TEST_ARGS)
 
             if not list_success:
                 self.logger.warning(f"List files test failed: {list_message}")
@@ -452,7 +745,8 @@ port = {config_data.get('port', 21)}
 
             # 第五步：测试删除
             self.logger.info(f"Testing delete file {remote_test_path + test_filename}")
-            delete_success, delete_message = self.delete_file(remote_test_path + test_filename, config_name)
+            delete_success, delete_message = self.delete_file(
+                remote_test_path + test_filename, config_name, extra_args=_CONNECTION_TEST_ARGS)
 
             if not delete_success:
                 self.logger.warning(f"Delete test failed: {delete_message}")
@@ -476,6 +770,26 @@ port = {config_data.get('port', 21)}
                 except Exception as e:
                     self.logger.warning(f"Failed to clean up temp file {temp_test_file}: {e}")
 
+    def _verify_config_format(self, config_name: str) -> bool:
+        """验证rclone能否正确读取指定配置段"""
+        if self.rc_client:
+            try:
+                return bool(self.rc_client.call('config/get', {'name': config_name}, timeout=10))
+            except RcloneRcError as e:
+                self.logger.error(f"Config verification failed: {e}")
+                return False
+
+        verify_args = ('config', 'show', config_name, *self._config_args)
+        verify_cmd = self._build_rclone_command(verify_args)
+
+        self._log_command("Verifying config format", verify_cmd)
+        verify_result = subprocess.run(verify_cmd, capture_output=True, text=True, timeout=10)
+
+        if verify_result.returncode != 0:
+            self.logger.error(f"Config verification failed: {verify_result.stderr}")
+            return False
+        return True
+
     def test_backup_upload(self, config_name: str, test_path: str = None) -> Tuple[bool, str]:
         """测试真实的备份上传流程"""
         import tempfile
@@ -488,7 +802,7 @@ port = {config_data.get('port', 21)}
 
             # 检查配置是否存在
             config_path = self.get_config_path()
-            if not os.path.exists(config_path):
+            if not self._config_path_exists(config_path):
                 return False, "配置文件不存在"
 
             if not self._config_section_exists(config_path, config_name):
@@ -517,14 +831,16 @@ port = {config_data.get('port', 21)}
 
             # 上传测试文件
             self.logger.info(f"Uploading test file to {config_name}:{remote_test_path}")
-            success, message = self.upload_file(temp_test_file, remote_test_path, config_name)
+            success, message = self.upload_file(
+                temp_test_file, remote_test_path, config_name, extra_args=_CONNECTION_TEST_ARGS)
 
             if not success:
                 return False, f"上传测试失败: {message}"
 
             # 验证文件是否上传成功（列出远程文件）
             self.logger.info(f"Verifying uploaded file in {remote_test_path}")
-            list_success, files, list_message = self.list_files(remote_test_path, config_name)
+            list_success, files, list_message = self.list_files(
+                remote_test_path, config_name, extra_args=_CONNECTION_TEST_ARGS)
 
             if not list_success:
                 self.logger.warning(f"Could not verify upload by listing files: {list_message}")
@@ -543,7 +859,8 @@ port = {config_data.get('port', 21)}
 
                 # 清理远程测试文件
                 remote_file_path = remote_test_path + test_filename
-                delete_success, delete_message = self.delete_file(remote_file_path, config_name)
+                delete_success, delete_message = self.delete_file(
+                    remote_file_path, config_name, extra_args=_CONNECTION_TEST_ARGS)
                 if delete_success:
                     self.logger.info(f"Cleaned up remote test file: {remote_file_path}")
                 else:
@@ -566,7 +883,8 @@ port = {config_data.get('port', 21)}
                 except Exception as e:
                     self.logger.warning(f"Could not clean up local test file: {e}")
     
-    def upload_file(self, local_path: str, remote_path: str, config_name: str) -> Tuple[bool, str]:
+    def upload_file(self, local_path: str, remote_path: str, config_name: str,
+                    extra_args: Sequence[str] = ()) -> Tuple[bool, str]:
         """上传文件到远程存储"""
         try:
             config_path = self.get_config_path(config_name)
@@ -580,7 +898,7 @@ port = {config_data.get('port', 21)}
             self.logger.info(f"Local path exists: {os.path.exists(local_path)}")
             self.logger.info(f"Absolute local path exists: {os.path.exists(abs_local_path)}")
 
-            if not os.path.exists(config_path):
+            if not self._config_path_exists(config_path):
                 self.logger.error(f"Config file does not exist: {config_path}")
                 return False, "配置文件不存在"
 
@@ -597,52 +915,52 @@ port = {config_data.get('port', 21)}
                 try:
                     with open(config_path, 'r', encoding='utf-8') as f:
                         config_content = f.read()
-                    self.logger.debug(f"Current rclone config file content:\n{config_content}")
+                    self.logger.debug("Current rclone config file content (masked):\n%s",
+                                      self._mask_config_text(config_content))
                 except Exception as e:
                     self.logger.warning(f"Could not read config file for logging: {e}")
 
+            if self.rc_client:
+                return self._rc_upload_file(local_path, remote_path, config_name, extra_args)
+
             # 构建rclone copy命令参数
-            copy_args = [
+            copy_args = (
                 'copy',
                 local_path,
                 f'{config_name}:{remote_path}',
-                '--config', config_path,
+                *self._config_args,
                 '--s3-no-check-bucket',  # 避免检查或创建bucket
-                '--progress',
+                *self._transfer_args,
                 '--stats', '1s',
-                '-vv'  # 增加详细输出
-            ]
+                '-vv',  # 增加详细输出
+                *extra_args
+            )
 
             cmd = self._build_rclone_command(copy_args)
 
             self.logger.info(f"Starting upload: {local_path} -> {config_name}:{remote_path}")
-            self.logger.info(f"Executing rclone command: {' '.join(cmd)}")
+            self._log_command("Executing rclone command", cmd)
 
             # 记录环境变量（如果有的话）
             env_vars = {k: v for k, v in os.environ.items() if 'RCLONE' in k or 'AWS' in k or 'S3' in k}
             if env_vars:
-                self.logger.info(f"Relevant environment variables: {env_vars}")
+                self.logger.info("Relevant environment variables (masked): %s", self._mask_mapping(env_vars))
             else:
                 self.logger.info("No relevant environment variables found")
 
             self.logger.info(f"Starting rclone subprocess with timeout=3600s")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600  # 1小时超时
-            )
+            returncode, stdout, stderr = self._run_with_output_tail(cmd, timeout=3600)  # 1小时超时
 
-            self.logger.info(f"rclone process completed with return code: {result.returncode}")
-            self.logger.info(f"rclone stdout:\n{result.stdout}")
-            self.logger.info(f"rclone stderr:\n{result.stderr}")
+            self.logger.info(f"rclone process completed with return code: {returncode}")
+            self.logger.info(f"rclone stdout (last {_OUTPUT_TAIL_LINES} lines):\n{stdout}")
+            self.logger.info(f"rclone stderr (last {_OUTPUT_TAIL_LINES} lines):\n{stderr}")
 
-            if result.returncode == 0:
+            if returncode == 0:
                 self.logger.info(f"Upload successful: {local_path}")
                 return True, "上传成功"
             else:
-                error_msg = result.stderr.strip() or result.stdout.strip()
-                self.logger.error(f"Upload failed with return code {result.returncode}")
+                error_msg = stderr.strip() or stdout.strip()
+                self.logger.error(f"Upload failed with return code {returncode}")
                 self.logger.error(f"Error message: {error_msg}")
                 return False, f"上传失败: {error_msg}"
 
@@ -660,7 +978,7 @@ port = {config_data.get('port', 21)}
             self.logger.info(f"Download parameters - remote_path: {remote_path}, local_path: {local_path}, config_name: {config_name}")
             self.logger.info(f"Using config file: {config_path}")
 
-            if not os.path.exists(config_path):
+            if not self._config_path_exists(config_path):
                 self.logger.error(f"Config file does not exist: {config_path}")
                 return False, "配置文件不存在"
 
@@ -669,33 +987,31 @@ port = {config_data.get('port', 21)}
             os.makedirs(local_dir, exist_ok=True)
             self.logger.info(f"Created local directory: {local_dir}")
 
+            if self.rc_client:
+                return self._rc_download_file(remote_path, local_path, config_name)
+
             # 构建rclone copy命令参数
-            copy_args = [
+            copy_args = (
                 'copy',
                 f'{config_name}:{remote_path}',
                 local_path,
-                '--config', config_path,
-                '--progress',
+                *self._config_args,
+                *self._transfer_args,
                 '-vv'  # 增加详细输出
-            ]
+            )
 
             cmd = self._build_rclone_command(copy_args)
 
             self.logger.info(f"Starting download: {config_name}:{remote_path} -> {local_path}")
-            self.logger.info(f"Executing rclone command: {' '.join(cmd)}")
+            self._log_command("Executing rclone command", cmd)
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600
-            )
+            returncode, stdout, stderr = self._run_with_output_tail(cmd, timeout=3600)
 
-            self.logger.info(f"rclone download process completed with return code: {result.returncode}")
-            self.logger.info(f"rclone download stdout:\n{result.stdout}")
-            self.logger.info(f"rclone download stderr:\n{result.stderr}")
+            self.logger.info(f"rclone download process completed with return code: {returncode}")
+            self.logger.info(f"rclone download stdout (last {_OUTPUT_TAIL_LINES} lines):\n{stdout}")
+            self.logger.info(f"rclone download stderr (last {_OUTPUT_TAIL_LINES} lines):\n{stderr}")
 
-            if result.returncode == 0:
+            if returncode == 0:
                 # 验证文件是否下载成功
                 if os.path.exists(local_path):
                     file_size = os.path.getsize(local_path)
@@ -704,8 +1020,8 @@ port = {config_data.get('port', 21)}
                     self.logger.warning(f"Download completed but file not found at: {local_path}")
                 return True, "下载成功"
             else:
-                error_msg = result.stderr.strip() or result.stdout.strip()
-                self.logger.error(f"Download failed with return code {result.returncode}")
+                error_msg = stderr.strip() or stdout.strip()
+                self.logger.error(f"Download failed with return code {returncode}")
                 self.logger.error(f"Error message: {error_msg}")
                 return False, f"下载失败: {error_msg}"
 
@@ -716,39 +1032,47 @@ port = {config_data.get('port', 21)}
             self.logger.error(f"Download error: {e}", exc_info=True)
             return False, f"下载失败: {str(e)}"
     
-    def list_files(self, remote_path: str, config_name: str) -> Tuple[bool, List[Dict], str]:
+    def list_files(self, remote_path: str, config_name: str,
+                   extra_args: Sequence[str] = ()) -> Tuple[bool, List[Dict], str]:
         """列出远程文件"""
         try:
             config_path = self.get_config_path(config_name)
             self.logger.info(f"List files parameters - remote_path: {remote_path}, config_name: {config_name}")
             self.logger.info(f"Using config file: {config_path}")
 
-            if not os.path.exists(config_path):
+            if not self._config_path_exists(config_path):
                 self.logger.error(f"Config file does not exist: {config_path}")
                 return False, [], "配置文件不存在"
 
+            if self.rc_client:
+                return self._rc_list_files(remote_path, config_name, extra_args)
+
             # 构建rclone lsjson命令参数
-            lsjson_args = [
+            lsjson_args = (
                 'lsjson',
                 f'{config_name}:{remote_path}',
-                '--config', config_path,
-                '-vv'  # 增加详细输出
-            ]
+                *self._config_args,
+                '-vv',  # 增加详细输出
+                *extra_args
+            )
 
             cmd = self._build_rclone_command(lsjson_args)
 
-            self.logger.info(f"Executing rclone list command: {' '.join(cmd)}")
+            self._log_command("Executing rclone list command", cmd)
 
+            # stdout保持bytes直接交给json解析，避免再解码出一份完整的文本副本
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=60
             )
+            stderr = result.stderr.decode('utf-8', errors='replace')
 
             self.logger.info(f"rclone list process completed with return code: {result.returncode}")
-            self.logger.info(f"rclone list stdout:\n{result.stdout}")
-            self.logger.info(f"rclone list stderr:\n{result.stderr}")
+            self.logger.info(f"rclone list stdout size: {len(result.stdout)} bytes")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("rclone list stdout:\n%s", result.stdout.decode('utf-8', errors='replace'))
+            self.logger.info(f"rclone list stderr:\n{stderr}")
 
             if result.returncode == 0:
                 try:
@@ -757,10 +1081,10 @@ port = {config_data.get('port', 21)}
                     return True, files, "获取成功"
                 except json.JSONDecodeError as e:
                     self.logger.error(f"Failed to parse JSON output: {e}")
-                    self.logger.error(f"Raw stdout: {result.stdout}")
+                    self.logger.error(f"Raw stdout: {result.stdout.decode('utf-8', errors='replace')}")
                     return False, [], "解析文件列表失败"
             else:
-                error_msg = result.stderr.strip() or result.stdout.strip()
+                error_msg = stderr.strip() or result.stdout.decode('utf-8', errors='replace').strip()
                 self.logger.error(f"List files failed with return code {result.returncode}")
                 self.logger.error(f"Error message: {error_msg}")
                 return False, [], f"获取失败: {error_msg}"
@@ -772,28 +1096,33 @@ port = {config_data.get('port', 21)}
             self.logger.error(f"List files error: {e}", exc_info=True)
             return False, [], f"获取失败: {str(e)}"
 
-    def delete_file(self, remote_path: str, config_name: str) -> Tuple[bool, str]:
+    def delete_file(self, remote_path: str, config_name: str,
+                    extra_args: Sequence[str] = ()) -> Tuple[bool, str]:
         """删除远程文件"""
         try:
             config_path = self.get_config_path(config_name)
             self.logger.info(f"Delete file parameters - remote_path: {remote_path}, config_name: {config_name}")
             self.logger.info(f"Using config file: {config_path}")
 
-            if not os.path.exists(config_path):
+            if not self._config_path_exists(config_path):
                 self.logger.error(f"Config file does not exist: {config_path}")
                 return False, "配置文件不存在"
 
+            if self.rc_client:
+                return self._rc_delete_file(remote_path, config_name, extra_args)
+
             # 构建rclone deletefile命令参数
-            delete_args = [
+            delete_args = (
                 'deletefile',
                 f'{config_name}:{remote_path}',
-                '--config', config_path,
-                '-vv'  # 增加详细输出
-            ]
+                *self._config_args,
+                '-vv',  # 增加详细输出
+                *extra_args
+            )
 
             cmd = self._build_rclone_command(delete_args)
 
-            self.logger.info(f"Executing rclone delete command: {' '.join(cmd)}")
+            self._log_command("Executing rclone delete command", cmd)
 
             result = subprocess.run(
                 cmd,
@@ -826,23 +1155,117 @@ port = {config_data.get('port', 21)}
             self.logger.error(f"Delete file error: {e}", exc_info=True)
             return False, f"删除文件失败: {str(e)}"
     
+    def _rc_upload_file(self, local_path: str, remote_path: str, config_name: str,
+                        extra_args: Sequence[str]) -> Tuple[bool, str]:
+        """通过rc接口上传文件，语义与 rclone copy 一致（remote_path为目标目录）"""
+        abs_local_path = os.path.abspath(local_path)
+        params = {
+            'srcFs': os.path.dirname(abs_local_path),
+            'srcRemote': os.path.basename(abs_local_path),
+            'dstFs': self._rc_fs(config_name, remote_path),
+            'dstRemote': os.path.basename(abs_local_path),
+            '_config': self._rc_options((*self._transfer_args, *extra_args)),
+        }
+        self.logger.info(f"Starting upload via rc: {local_path} -> {config_name}:{remote_path}")
+        try:
+            self.rc_client.call('operations/copyfile', params, timeout=3600)
+        except TimeoutError:
+            self.logger.error("Upload via rc timed out after 3600 seconds")
+            return False, "上传超时"
+        except RcloneRcError as e:
+            self.logger.error(f"Upload via rc failed: {e}")
+            return False, f"上传失败: {e}"
+
+        self.logger.info(f"Upload successful: {local_path}")
+        return True, "上传成功"
+
+    def _rc_download_file(self, remote_path: str, local_path: str, config_name: str) -> Tuple[bool, str]:
+        """通过rc接口下载文件，语义与 rclone copy 一致（local_path为目标目录）"""
+        params = {
+            'srcFs': f'{config_name}:',
+            'srcRemote': remote_path,
+            'dstFs': os.path.abspath(local_path),
+            'dstRemote': os.path.basename(remote_path.rstrip('/')),
+            '_config': self._rc_options(self._transfer_args),
+        }
+        self.logger.info(f"Starting download via rc: {config_name}:{remote_path} -> {local_path}")
+        try:
+            self.rc_client.call('operations/copyfile', params, timeout=3600)
+        except TimeoutError:
+            self.logger.error("Download via rc timed out after 3600 seconds")
+            return False, "下载超时"
+        except RcloneRcError as e:
+            self.logger.error(f"Download via rc failed: {e}")
+            return False, f"下载失败: {e}"
+
+        self.logger.info(f"Download successful: {remote_path}")
+        return True, "下载成功"
+
+    def _rc_list_files(self, remote_path: str, config_name: str,
+                       extra_args: Sequence[str]) -> Tuple[bool, List[Dict], str]:
+        """通过rc接口列出远程文件，返回格式与 rclone lsjson 一致"""
+        params = {
+            'fs': f'{config_name}:{remote_path}',
+            'remote': '',
+            '_config': self._rc_options(extra_args),
+        }
+        try:
+            result = self.rc_client.call('operations/list', params, timeout=60)
+        except TimeoutError:
+            self.logger.error("List files via rc timed out after 60 seconds")
+            return False, [], "获取文件列表超时"
+        except RcloneRcError as e:
+            self.logger.error(f"List files via rc failed: {e}")
+            return False, [], f"获取失败: {e}"
+
+        files = result.get('list') or []
+        self.logger.info(f"Successfully listed {len(files)} files from remote path: {remote_path}")
+        return True, files, "获取成功"
+
+    def _rc_delete_file(self, remote_path: str, config_name: str,
+                        extra_args: Sequence[str]) -> Tuple[bool, str]:
+        """通过rc接口删除远程文件"""
+        params = {
+            'fs': f'{config_name}:',
+            'remote': remote_path,
+            '_config': self._rc_options(extra_args),
+        }
+        try:
+            self.rc_client.call('operations/deletefile', params, timeout=300)
+        except TimeoutError:
+            self.logger.error("Delete via rc timed out after 300 seconds")
+            return False, "删除操作超时"
+        except RcloneRcError as e:
+            error_msg = str(e)
+            # 如果文件不存在，也认为是成功的
+            if "not found" in error_msg.lower() or "does not exist" in error_msg.lower():
+                self.logger.info(f"File not found (already deleted): {remote_path}")
+                return True, "文件不存在（已删除）"
+            self.logger.error(f"Delete via rc failed: {error_msg}")
+            return False, f"删除失败: {error_msg}"
+
+        self.logger.info(f"Delete successful: {remote_path}")
+        return True, "删除成功"
+
     def delete_config(self, config_name: str) -> bool:
         """删除rclone配置"""
         try:
             config_path = self.get_config_path()
-            if not os.path.exists(config_path):
+            if not self._config_path_exists(config_path):
                 return True  # 配置文件不存在，认为删除成功
 
             # 读取现有配置
-            with open(config_path, 'r', encoding='utf-8') as f:
+            with open(config_path, 'rb') as f:
                 existing_config = f.read()
 
-            # 删除指定配置段
-            new_config = self._remove_config_section(existing_config, config_name)
+            # 定位指定配置段的字节范围
+            spans = self._find_section_spans(existing_config, config_name)
+            if not spans:
+                self.logger.info(f"Config section '{config_name}' not found, nothing to delete")
+                return True
 
-            # 写回配置文件
-            with open(config_path, 'w', encoding='utf-8') as f:
-                f.write(new_config)
+            # 只保留目标段以外的字节，写回配置文件
+            self._write_config_file(config_path, self._remove_section_spans(existing_config, spans))
 
             self.logger.info(f"Deleted rclone config: {config_name}")
             return True
@@ -854,7 +1277,7 @@ port = {config_data.get('port', 21)}
         """解析rclone配置文件，返回所有配置段"""
         try:
             config_path = self.get_config_path()
-            if not os.path.exists(config_path):
+            if not self._config_path_exists(config_path):
                 return {}
 
             with open(config_path, 'r', encoding='utf-8') as f:
@@ -888,13 +1311,14 @@ port = {config_data.get('port', 21)}
                 continue
 
             # 检查是否是配置段开始
-            if line.startswith('[') and line.endswith(']'):
+            header = _SECTION_HEADER_RE.match(line)
+            if header:
                 # 保存上一个配置段
                 if current_section and current_config:
                     configs[current_section] = current_config
 
                 # 开始新的配置段
-                current_section = line[1:-1]
+                current_section = header.group(1)
                 current_config = {}
             elif current_section and '=' in line:
                 # 解析配置项
@@ -4,27 +4,45 @@
 """
 
 import logging
+import traceback
+from concurrent.futures import ThreadPoolExecutor as CleanupExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import List
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.jobstores.base import JobLookupError
+from sqlalchemy.orm import joinedload
 
-from models import db, BackupTask
+from models import db, BackupTask, BackupLog, LOCAL_TZ
+# backup_service不依赖本模块，可在模块级导入而不会产生循环引用
+from services.backup_service import BackupService
 
 
 # 全局应用实例引用
 _app_instance = None
 
+# 定时清理时并发删除远程文件的任务数，清理耗时主要在远程存储的删除上
+_CLEANUP_MAX_WORKERS = 8
+
+# 定时任务共用的备份服务实例，首次使用时创建
+_backup_service = None
+
 def set_app_instance(app):
     """设置应用实例引用"""
     global _app_instance
     _app_instance = app
 
+def _get_backup_service() -> BackupService:
+    """获取定时任务共用的备份服务实例（BackupService不保存单次任务的状态，可跨任务复用）"""
+    global _backup_service
+    if _backup_service is None:
+        _backup_service = BackupService()
+    return _backup_service
+
 def run_scheduled_backup_task(task_id: int):
     """独立的备份任务执行函数，避免调度器序列化问题"""
-    import logging
     logger = logging.getLogger(__name__)
 
     try:
@@ -33,11 +51,9 @@ def run_scheduled_backup_task(task_id: int):
         # 确保在应用上下文中运行
         if _app_instance:
             with _app_instance.app_context():
-                # 动态导入BackupService，避免循环引用
-                from services.backup_service import BackupService
-                backup_service = BackupService()
-
-                success, message = backup_service.run_backup_task(task_id, manual=False)
+                # 在作业线程中同步执行备份，作业在备份结束后才返回，
+                # 调度器据此判断任务是否仍在运行（max_instances/coalesce才能生效）
+                success, message = _get_backup_service().run_backup_task(task_id, manual=False, wait=True)
 
                 if success:
                     logger.info(f"Scheduled backup task {task_id} completed successfully")
@@ -48,13 +64,11 @@ def run_scheduled_backup_task(task_id: int):
 
     except Exception as e:
         logger.error(f"Error running scheduled backup task {task_id}: {e}")
-        import traceback
         traceback.print_exc()
 
 
 def run_scheduled_cleanup():
     """独立的清理任务执行函数，避免调度器序列化问题"""
-    import logging
     logger = logging.getLogger(__name__)
 
     try:
@@ -63,21 +77,42 @@ def run_scheduled_cleanup():
         # 确保在应用上下文中运行
         if _app_instance:
             with _app_instance.app_context():
-                # 动态导入所需模块，避免循环引用
-                from models import BackupTask
-                from services.backup_service import BackupService
+                backup_service = _get_backup_service()
 
-                # 获取所有活跃的任务
-                tasks = BackupTask.query.filter_by(is_active=True).all()
-                backup_service = BackupService()
+                # 获取所有活跃的任务，同时预加载清理时要用到的存储配置
+                tasks = BackupTask.query.options(
+                    joinedload(BackupTask.storage_config)
+                ).filter_by(is_active=True).all()
 
+                # 在当前线程中查出各任务超出保留数量的日志
+                expired = []
                 for task in tasks:
-                    try:
-                        # 使用备份服务的清理方法
-                        backup_service._cleanup_old_backups(task)
-                    except Exception as e:
-                        logger.error(f"Error cleaning up backups for task {task.name}: {e}")
-                        continue
+                    logs = backup_service._get_expired_backup_logs(task)
+                    if logs:
+                        expired.append((task, logs))
+                # 与当前会话分离，交给各工作线程只读使用（属性均已加载）
+                db.session.expunge_all()
+
+                # 各任务的远程文件删除互不影响，并发执行以重叠远程存储的网络延迟；
+                # 工作线程不访问数据库，日志记录统一在当前线程中删除并提交一次，避免SQLite并发写入锁冲突
+                log_ids = []
+                with CleanupExecutor(max_workers=_CLEANUP_MAX_WORKERS) as executor:
+                    futures = {
+                        executor.submit(backup_service._delete_expired_backup_files, task, logs): task
+                        for task, logs in expired
+                    }
+                    for future in as_completed(futures):
+                        task = futures[future]
+                        try:
+                            task_log_ids = future.result()
+                            log_ids.extend(task_log_ids)
+                            logger.info(f"Cleaned up {len(task_log_ids)} old backups for task {task.name}")
+                        except Exception as e:
+                            logger.error(f"Error cleaning up backups for task {task.name}: {e}")
+
+                if log_ids:
+                    BackupLog.query.filter(BackupLog.id.in_(log_ids)).delete(synchronize_session=False)
+                    db.session.commit()
 
                 logger.info("Completed scheduled backup cleanup")
         else:
@@ -85,14 +120,11 @@ def run_scheduled_cleanup():
 
     except Exception as e:
         logger.error(f"Error in scheduled backup cleanup: {e}")
-        import traceback
         traceback.print_exc()
 
 
 def run_scheduled_task_check():
     """独立的任务状态检查函数，避免调度器序列化问题"""
-    import logging
-    from datetime import datetime, timedelta
     logger = logging.getLogger(__name__)
 
     try:
@@ -101,35 +133,28 @@ def run_scheduled_task_check():
         # 确保在应用上下文中运行
         if _app_instance:
             with _app_instance.app_context():
-                # 动态导入所需模块
-                from models import db, BackupLog
-
                 # 检查运行时间过长的任务（超过6小时）
-                import pytz
-                local_tz = pytz.timezone('Asia/Shanghai')
-                current_time = datetime.now(local_tz).replace(tzinfo=None)
+                current_time = datetime.now(LOCAL_TZ).replace(tzinfo=None)
                 cutoff_time = current_time - timedelta(hours=6)
 
-                stuck_logs = BackupLog.query.filter(
+                # 单条UPDATE批量标记，无需逐条加载日志对象
+                updated = BackupLog.query.filter(
                     BackupLog.status == 'running',
                     BackupLog.start_time < cutoff_time
-                ).all()
-
-                for log in stuck_logs:
-                    log.status = 'failed'
-                    log.end_time = current_time
-                    log.error_message = '任务执行超时，已自动标记为失败'
-                    logger.warning(f"Marked stuck backup log {log.id} as failed")
+                ).update({
+                    BackupLog.status: 'failed',
+                    BackupLog.end_time: current_time,
+                    BackupLog.error_message: '任务执行超时，已自动标记为失败'
+                }, synchronize_session=False)
 
-                if stuck_logs:
+                if updated:
                     db.session.commit()
-                    logger.info(f"Cleaned up {len(stuck_logs)} stuck backup logs")
+                    logger.warning(f"Marked {updated} stuck backup logs as failed")
         else:
             logger.error("App instance not available for scheduled task check")
 
     except Exception as e:
         logger.error(f"Error checking task status: {e}")
-        import traceback
         traceback.print_exc()
 
 
@@ -137,6 +162,10 @@ class SchedulerService:
     def __init__(self, app=None):
         self.logger = logging.getLogger(__name__)
         self.scheduler = None
+        # 调度器中备份任务作业ID的索引，避免每次遍历全部作业
+        self._backup_job_ids = set()
+        # Cron表达式 -> 触发器缓存，CronTrigger不保存运行状态，相同表达式可共用
+        self._trigger_cache = {}
 
         if app:
             self.init_app(app)
@@ -147,27 +176,26 @@ class SchedulerService:
             # 设置应用实例引用，供独立函数使用
             set_app_instance(app)
 
+            # 调度器已在运行时直接复用，避免重复创建调度器并重新加载全部任务
+            if self.scheduler and self.scheduler.running:
+                self.logger.info("Scheduler already running, skipping initialization")
+                return
+
             # 配置作业存储
             jobstores = {
                 'default': SQLAlchemyJobStore(url=app.config['SQLALCHEMY_DATABASE_URI'])
             }
             
-            # 配置执行器
+            # 配置执行器：备份任务使用独立的线程池，不占用系统维护任务的线程
             executors = {
-                'default': ThreadPoolExecutor(20)
-            }
-            
-            # 作业默认设置
-            job_defaults = {
-                'coalesce': False,
-                'max_instances': 3
+                'default': ThreadPoolExecutor(20),
+                'backup': ThreadPoolExecutor(20)
             }
             
             # 创建调度器
             self.scheduler = BackgroundScheduler(
                 jobstores=jobstores,
                 executors=executors,
-                job_defaults=job_defaults,
                 timezone='Asia/Shanghai'
             )
             
@@ -185,6 +213,12 @@ class SchedulerService:
             if self.scheduler and not self.scheduler.running:
                 self.scheduler.start()
                 self.logger.info("Scheduler started")
+
+                # 从作业存储中加载上次运行遗留的备份任务作业ID
+                self._backup_job_ids = {
+                    job.id for job in self.scheduler.get_jobs()
+                    if job.id.startswith('backup_task_')
+                }
                 
                 # 重新加载所有备份任务
                 self.reload_backup_tasks()
@@ -205,25 +239,29 @@ class SchedulerService:
         """重新加载所有备份任务"""
         try:
             # 清除现有的备份任务作业
-            jobs = self.scheduler.get_jobs()
-            for job in jobs:
-                if job.id.startswith('backup_task_'):
-                    self.scheduler.remove_job(job.id)
+            for job_id in list(self._backup_job_ids):
+                try:
+                    self.scheduler.remove_job(job_id)
+                except JobLookupError:
+                    pass
+            self._backup_job_ids.clear()
             
             # 加载活跃的备份任务
             active_tasks = BackupTask.query.filter_by(is_active=True).all()
             
+            # 各任务的下次运行时间统一在最后提交一次
             for task in active_tasks:
                 if task.cron_expression:
-                    self.add_backup_task(task)
+                    self.add_backup_task(task, defer_commit=True)
+            db.session.commit()
             
             self.logger.info(f"Reloaded {len(active_tasks)} backup tasks")
             
         except Exception as e:
             self.logger.error(f"Failed to reload backup tasks: {e}")
     
-    def add_backup_task(self, task: BackupTask):
-        """添加备份任务到调度器"""
+    def add_backup_task(self, task: BackupTask, defer_commit: bool = False):
+        """添加备份任务到调度器，defer_commit为True时由调用方负责提交next_run_at的更新"""
         try:
             if not task.cron_expression:
                 return
@@ -236,24 +274,11 @@ class SchedulerService:
             except:
                 pass
             
-            # 解析Cron表达式
-            cron_parts = task.cron_expression.split()
-            if len(cron_parts) != 5:
+            trigger = self._get_cron_trigger(task.cron_expression)
+            if trigger is None:
                 self.logger.error(f"Invalid cron expression for task {task.id}: {task.cron_expression}")
                 return
             
-            minute, hour, day, month, day_of_week = cron_parts
-            
-            # 创建Cron触发器
-            trigger = CronTrigger(
-                minute=minute,
-                hour=hour,
-                day=day,
-                month=month,
-                day_of_week=day_of_week,
-                timezone='Asia/Shanghai'
-            )
-            
             # 添加作业
             self.scheduler.add_job(
                 func=run_scheduled_backup_task,
@@ -261,8 +286,15 @@ class SchedulerService:
                 id=job_id,
                 name=f"备份任务: {task.name}",
                 args=[task.id],
+                executor='backup',
+                # 错过的多次运行合并为一次，同一任务不重叠执行，
+                # 短暂停机后5分钟内仍会补跑，超过则跳过本次
+                coalesce=True,
+                max_instances=1,
+                misfire_grace_time=300,
                 replace_existing=True
             )
+            self._backup_job_ids.add(job_id)
             
             # 更新下次运行时间
             job = self.scheduler.get_job(job_id)
@@ -271,22 +303,47 @@ class SchedulerService:
                 next_run = job.next_run_time
                 if next_run.tzinfo:
                     # 转换为本地时间
-                    import pytz
-                    local_tz = pytz.timezone('Asia/Shanghai')
-                    next_run = next_run.astimezone(local_tz).replace(tzinfo=None)
+                    next_run = next_run.astimezone(LOCAL_TZ).replace(tzinfo=None)
 
                 task.next_run_at = next_run
-                db.session.commit()
+                if not defer_commit:
+                    db.session.commit()
             
             self.logger.info(f"Added backup task {task.name} to scheduler")
             
         except Exception as e:
             self.logger.error(f"Failed to add backup task {task.id} to scheduler: {e}")
 
+    def _get_cron_trigger(self, cron_expression: str):
+        """根据Cron表达式获取触发器，已解析过的表达式直接复用；格式不正确时返回None"""
+        trigger = self._trigger_cache.get(cron_expression)
+        if trigger is not None:
+            return trigger
+
+        # 解析Cron表达式
+        cron_parts = cron_expression.split()
+        if len(cron_parts) != 5:
+            return None
+
+        minute, hour, day, month, day_of_week = cron_parts
+
+        # 创建Cron触发器
+        trigger = CronTrigger(
+            minute=minute,
+            hour=hour,
+            day=day,
+            month=month,
+            day_of_week=day_of_week,
+            timezone='Asia/Shanghai'
+        )
+        self._trigger_cache[cron_expression] = trigger
+        return trigger
+
     def remove_backup_task(self, task_id: int):
         """从调度器中移除备份任务"""
         try:
             job_id = f"backup_task_{task_id}"
+            self._backup_job_ids.discard(job_id)
             self.scheduler.remove_job(job_id)
             self.logger.info(f"Removed backup task {task_id} from scheduler")
         except Exception as e:
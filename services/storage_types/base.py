@@ -10,26 +10,34 @@ from typing import Dict, Tuple, Optional
 
 class BaseStorageType(ABC):
     """存储类型基类"""
+
+    # 内置存储类型的实例不保存状态，不需要__dict__（子类不声明__slots__时仍会有__dict__）
+    __slots__ = ()
+
+    # 存储类型元数据，子类以类属性声明（TYPE_ID、DISPLAY_NAME、TEMPLATE_NAME必须提供）
+    TYPE_ID: Optional[str] = None  # 存储类型ID（用于内部标识）
+    DISPLAY_NAME: Optional[str] = None  # 显示名称（用于用户界面）
+    TEMPLATE_NAME: Optional[str] = None  # 前端模板文件名
+    REQUIRED_FIELDS: Tuple[str, ...] = ()  # 必填字段
+    ICON_CLASS = "bi bi-cloud"  # 图标CSS类
+    ICON_COLOR = "#6c757d"  # 图标颜色
+    DESCRIPTION: Optional[str] = None  # 存储类型描述，未设置时根据显示名称生成
     
-    @abstractmethod
     def get_type_id(self) -> str:
         """获取存储类型ID（用于内部标识）"""
-        pass
+        return self.TYPE_ID
     
-    @abstractmethod
     def get_display_name(self) -> str:
         """获取显示名称（用于用户界面）"""
-        pass
+        return self.DISPLAY_NAME
     
-    @abstractmethod
     def get_template_name(self) -> str:
         """获取前端模板文件名"""
-        pass
+        return self.TEMPLATE_NAME
     
-    @abstractmethod
-    def get_required_fields(self) -> list:
-        """获取必填字段列表"""
-        pass
+    def get_required_fields(self) -> Tuple[str, ...]:
+        """获取必填字段（只读元组）"""
+        return self.REQUIRED_FIELDS
     
     @abstractmethod
     def process_form_data(self, form_data: dict) -> dict:
@@ -71,16 +79,16 @@ class BaseStorageType(ABC):
         pass
     
     def get_icon_class(self) -> str:
-        """获取图标CSS类（可选重写）"""
-        return "bi bi-cloud"
+        """获取图标CSS类"""
+        return self.ICON_CLASS
     
     def get_icon_color(self) -> str:
-        """获取图标颜色（可选重写）"""
-        return "#6c757d"
+        """获取图标颜色"""
+        return self.ICON_COLOR
     
     def get_description(self) -> str:
-        """获取存储类型描述（可选重写）"""
-        return f"{self.get_display_name()} 存储服务"
+        """获取存储类型描述"""
+        return self.DESCRIPTION or f"{self.get_display_name()} 存储服务"
     
     def supports_test_connection(self) -> bool:
         """是否支持连接测试（可选重写）"""
@@ -4,8 +4,10 @@
 只保留真正有价值的S3兼容构造器
 """
 
+from .constants import RCLONE_TRUE
 from .s3_compatible_builder import S3CompatibleBuilder
 
 __all__ = [
-    'S3CompatibleBuilder'
+    'S3CompatibleBuilder',
+    'RCLONE_TRUE'
 ]
@@ -0,0 +1,10 @@
+"""
+构造器常量
+
+各存储类型构造配置时共用的常量
+"""
+
+import sys
+
+# rclone配置中布尔选项的取值，各存储类型共用同一个字符串对象
+RCLONE_TRUE = sys.intern('true')
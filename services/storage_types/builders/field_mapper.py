@@ -4,21 +4,28 @@
 提供表单字段到配置字段的映射功能
 """
 
+import sys
 from typing import Dict, List, Optional, Any
 
 
 class FieldMapper:
     """字段映射构造器"""
+
+    __slots__ = ('field_mappings', 'default_values', 'optional_fields', 'conditional_fields', '_frozen')
     
     def __init__(self):
         self.field_mappings = {}
         self.default_values = {}
         self.optional_fields = set()
         self.conditional_fields = {}
+        # map_fields使用的固化映射表，映射表变更后失效
+        self._frozen = None
     
     def add_mapping(self, form_field: str, config_field: str, required: bool = True) -> 'FieldMapper':
-        """添加字段映射"""
-        self.field_mappings[form_field] = config_field
+        """添加字段映射（字段名驻留，保证表单字典查找走指针相等的快速路径）"""
+        form_field = sys.intern(form_field)
+        self.field_mappings[form_field] = sys.intern(config_field)
+        self._frozen = None
         if not required:
             self.optional_fields.add(form_field)
         return self
@@ -26,33 +33,48 @@ class FieldMapper:
     def add_default(self, config_field: str, default_value: Any) -> 'FieldMapper':
         """添加默认值"""
         self.default_values[config_field] = default_value
+        self._frozen = None
         return self
     
     def add_conditional(self, form_field: str, config_field: str, condition_func) -> 'FieldMapper':
         """添加条件字段（只有满足条件时才添加）"""
         self.conditional_fields[form_field] = (config_field, condition_func)
+        self._frozen = None
         return self
     
+    def _freeze(self) -> tuple:
+        """将当前映射表固化为元组，映射表不变时map_fields直接复用"""
+        self._frozen = (
+            tuple(self.field_mappings.items()),
+            tuple(self.default_values.items()),
+            tuple(
+                (form_field, config_field, condition_func)
+                for form_field, (config_field, condition_func) in self.conditional_fields.items()
+            )
+        )
+        return self._frozen
+    
     def map_fields(self, form_data: dict) -> dict:
         """执行字段映射"""
+        mappings, defaults, conditionals = self._frozen or self._freeze()
+        get = form_data.get
         config = {}
         
-        # 处理基本映射
-        for form_field, config_field in self.field_mappings.items():
-            value = form_data.get(form_field, '').strip()
-            if value or form_field in self.optional_fields:
-                if value:  # 只有非空值才添加
-                    config[config_field] = value
+        # 处理基本映射（只有非空值才添加）
+        for form_field, config_field in mappings:
+            value = get(form_field, '').strip()
+            if value:
+                config[config_field] = value
         
         # 处理默认值
-        for config_field, default_value in self.default_values.items():
+        for config_field, default_value in defaults:
             if config_field not in config:
                 config[config_field] = default_value
         
         # 处理条件字段
-        for form_field, (config_field, condition_func) in self.conditional_fields.items():
+        for form_field, config_field, condition_func in conditionals:
             if condition_func(form_data):
-                value = form_data.get(form_field, '').strip()
+                value = get(form_field, '').strip()
                 if value:
                     config[config_field] = value
         
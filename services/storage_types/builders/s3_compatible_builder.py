@@ -4,12 +4,18 @@
 只负责表单数据到rclone配置的转换
 """
 
+import sys
 from typing import Dict, Tuple
 
+from .constants import RCLONE_TRUE
+
 
 class S3CompatibleBuilder:
     """简化的S3兼容存储构造器"""
 
+    __slots__ = ('provider', 'field_mappings', 'required_fields', 'endpoint_required', 'default_values',
+                 '_items_cache', '_defaults_cache', '_required_resolved')
+
     def __init__(self, provider: str):
         self.provider = provider
         self.field_mappings = {
@@ -19,70 +25,81 @@ class S3CompatibleBuilder:
             'endpoint': 'endpoint',
             'bucket': 'bucket'
         }
-        self.required_fields = ['access_key', 'secret_key']
+        # 必填字段（dict作有序集合：成员判断O(1)，验证时按添加顺序报告）
+        self.required_fields = dict.fromkeys(['access_key', 'secret_key'])
         self.endpoint_required = False
         self.default_values = {}  # 默认值字典
+        # 处理表单时遍历的映射和默认值元组，构造器方法修改时同步更新
+        self._items_cache = tuple(self.field_mappings.items())
+        self._defaults_cache = ()
+        self._resolve_required_fields()
+
+    def _resolve_required_fields(self):
+        """预先计算必填字段对应的rclone字段，映射或必填字段变化时重新计算"""
+        self._required_resolved = [
+            (field, self.field_mappings.get(field, field))
+            for field in self.required_fields
+        ]
 
     def add_field_mapping(self, form_field: str, rclone_field: str) -> 'S3CompatibleBuilder':
-        """添加自定义字段映射"""
-        self.field_mappings[form_field] = rclone_field
+        """添加自定义字段映射（字段名驻留，保证表单字典查找走指针相等的快速路径）"""
+        self.field_mappings[sys.intern(form_field)] = sys.intern(rclone_field)
+        self._items_cache = tuple(self.field_mappings.items())
+        self._resolve_required_fields()
         return self
 
     def set_endpoint_required(self, required: bool = True) -> 'S3CompatibleBuilder':
         """设置端点是否必填"""
         self.endpoint_required = required
         if required and 'endpoint' not in self.required_fields:
-            self.required_fields.append('endpoint')
+            self.required_fields['endpoint'] = None
+            self._resolve_required_fields()
         return self
 
     def add_default_value(self, field: str, value: str) -> 'S3CompatibleBuilder':
         """添加默认值"""
         self.default_values[field] = value
+        self._defaults_cache = tuple(self.default_values.items())
         return self
 
     def process_form_data(self, form_data: dict) -> dict:
         """处理表单数据，直接生成rclone配置格式"""
         config = {}
+        get = form_data.get
 
         # 映射表单字段到rclone字段
-        for form_field, rclone_field in self.field_mappings.items():
-            value = form_data.get(form_field, '').strip()
+        for form_field, rclone_field in self._items_cache:
+            value = get(form_field, '').strip()
             if value:
                 config[rclone_field] = value
 
         # 添加默认值
-        for field, value in self.default_values.items():
+        for field, value in self._defaults_cache:
             if field not in config:
                 config[field] = value
 
         # 如果有端点，设置path style
         if config.get('endpoint'):
-            config['force_path_style'] = 'true'
+            config['force_path_style'] = RCLONE_TRUE
 
         return config
 
     def validate_config(self, config_data: dict) -> Tuple[bool, str]:
         """基本验证 - 只检查必填字段"""
-        for field in self.required_fields:
-            rclone_field = self.field_mappings.get(field, field)
+        for field, rclone_field in self._required_resolved:
             if not config_data.get(rclone_field):
                 return False, f"{field} 不能为空"
 
         # 检查端点格式
-        endpoint = config_data.get('endpoint', '')
-        if endpoint and (endpoint.startswith('http://') or endpoint.startswith('https://')):
+        endpoint = config_data.get('endpoint') or ''
+        if endpoint.startswith(('http://', 'https://')):
             return False, "端点地址不应包含协议前缀"
 
         return True, ""
 
     def get_rclone_config(self, config_data: dict) -> dict:
         """生成rclone配置"""
-        rclone_config = {
-            'type': 's3',
-            'provider': self.provider
-        }
-        rclone_config.update(config_data)
-        return rclone_config
+        return {'type': 's3', 'provider': self.provider, **config_data}
 
     @staticmethod
     def create_aws_s3() -> 'S3CompatibleBuilder':
@@ -11,30 +11,19 @@ from ..builders import S3CompatibleBuilder
 
 class AlibabaOSSStorageType(BaseStorageType):
     """阿里云 OSS 存储类型"""
-    
-    def __init__(self):
-        self.builder = S3CompatibleBuilder.create_alibaba_oss()
-    
-    def get_type_id(self) -> str:
-        return "alibaba_oss"
-    
-    def get_display_name(self) -> str:
-        return "阿里云 OSS"
-    
-    def get_template_name(self) -> str:
-        return "storage_types/alibaba_oss_config.html"
-    
-    def get_required_fields(self) -> list:
-        return ["oss_access_key", "oss_secret_key", "oss_endpoint"]
-    
-    def get_icon_class(self) -> str:
-        return "bi bi-cloud"
-    
-    def get_icon_color(self) -> str:
-        return "#ff6a00"
-    
-    def get_description(self) -> str:
-        return "阿里云对象存储服务，使用S3兼容协议访问"
+
+    __slots__ = ()
+
+    TYPE_ID = "alibaba_oss"
+    DISPLAY_NAME = "阿里云 OSS"
+    TEMPLATE_NAME = "storage_types/alibaba_oss_config.html"
+    REQUIRED_FIELDS = ("oss_access_key", "oss_secret_key", "oss_endpoint")
+    ICON_CLASS = "bi bi-cloud"
+    ICON_COLOR = "#ff6a00"
+    DESCRIPTION = "阿里云对象存储服务，使用S3兼容协议访问"
+    
+    # 构造器不保存表单数据，所有实例共用一个
+    builder = S3CompatibleBuilder.create_alibaba_oss()
     
     def process_form_data(self, form_data: dict) -> dict:
         """处理阿里云OSS表单数据"""
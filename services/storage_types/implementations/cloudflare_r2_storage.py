@@ -11,30 +11,19 @@ from ..builders import S3CompatibleBuilder
 
 class CloudflareR2StorageType(BaseStorageType):
     """Cloudflare R2 存储类型"""
-    
-    def __init__(self):
-        self.builder = S3CompatibleBuilder.create_cloudflare_r2()
-    
-    def get_type_id(self) -> str:
-        return "cloudflare_r2"
-    
-    def get_display_name(self) -> str:
-        return "Cloudflare R2"
-    
-    def get_template_name(self) -> str:
-        return "storage_types/cloudflare_r2_config.html"
-    
-    def get_required_fields(self) -> list:
-        return ["r2_access_key", "r2_secret_key", "r2_endpoint"]
-    
-    def get_icon_class(self) -> str:
-        return "bi bi-cloud"
-    
-    def get_icon_color(self) -> str:
-        return "#f38020"
-    
-    def get_description(self) -> str:
-        return "Cloudflare R2 对象存储服务，使用S3兼容协议访问"
+
+    __slots__ = ()
+
+    TYPE_ID = "cloudflare_r2"
+    DISPLAY_NAME = "Cloudflare R2"
+    TEMPLATE_NAME = "storage_types/cloudflare_r2_config.html"
+    REQUIRED_FIELDS = ("r2_access_key", "r2_secret_key", "r2_endpoint")
+    ICON_CLASS = "bi bi-cloud"
+    ICON_COLOR = "#f38020"
+    DESCRIPTION = "Cloudflare R2 对象存储服务，使用S3兼容协议访问"
+    
+    # 构造器不保存表单数据，所有实例共用一个
+    builder = S3CompatibleBuilder.create_cloudflare_r2()
     
     def process_form_data(self, form_data: dict) -> dict:
         """处理Cloudflare R2表单数据"""
@@ -6,31 +6,21 @@ FTP 存储类型实现
 
 from typing import Dict, Tuple
 from ..base import BaseStorageType
+from ..builders import RCLONE_TRUE
 
 
 class FTPStorageType(BaseStorageType):
     """FTP 存储类型"""
-    
-    def get_type_id(self) -> str:
-        return "ftp"
-    
-    def get_display_name(self) -> str:
-        return "FTP"
-    
-    def get_template_name(self) -> str:
-        return "storage_types/ftp_config.html"
-    
-    def get_required_fields(self) -> list:
-        return ["host", "username", "password"]
-    
-    def get_icon_class(self) -> str:
-        return "bi bi-folder-symlink"
-    
-    def get_icon_color(self) -> str:
-        return "#6f42c1"
-    
-    def get_description(self) -> str:
-        return "文件传输协议，标准FTP连接"
+
+    __slots__ = ()
+
+    TYPE_ID = "ftp"
+    DISPLAY_NAME = "FTP"
+    TEMPLATE_NAME = "storage_types/ftp_config.html"
+    REQUIRED_FIELDS = ("host", "username", "password")
+    ICON_CLASS = "bi bi-folder-symlink"
+    ICON_COLOR = "#6f42c1"
+    DESCRIPTION = "文件传输协议，标准FTP连接"
     
     def process_form_data(self, form_data: dict) -> dict:
         """处理FTP表单数据 - 直接映射字段"""
@@ -48,10 +38,10 @@ class FTPStorageType(BaseStorageType):
 
         # FTP选项
         if form_data.get('tls'):
-            config['tls'] = 'true'
+            config['tls'] = RCLONE_TRUE
 
         if form_data.get('passive'):
-            config['passive'] = 'true'
+            config['passive'] = RCLONE_TRUE
 
         return config
 
@@ -70,6 +60,4 @@ class FTPStorageType(BaseStorageType):
 
     def get_rclone_config(self, config_data: dict) -> dict:
         """生成FTP的rclone配置"""
-        rclone_config = {'type': 'ftp'}
-        rclone_config.update(config_data)
-        return rclone_config
+        return {'type': 'ftp', **config_data}
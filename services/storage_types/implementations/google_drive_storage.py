@@ -8,29 +8,46 @@ from typing import Dict, Tuple
 from ..base import BaseStorageType
 
 
+def _fill_oauth(form_data: dict, config: dict) -> None:
+    """OAuth2配置：客户端凭据可选，留空使用rclone默认值"""
+    client_id = form_data.get('client_id', '').strip()
+    if client_id:
+        config['client_id'] = client_id
+
+    client_secret = form_data.get('client_secret', '').strip()
+    if client_secret:
+        config['client_secret'] = client_secret
+
+
+def _fill_service_account(form_data: dict, config: dict) -> None:
+    """服务账户配置"""
+    service_account_file = form_data.get('service_account_file', '').strip()
+    if service_account_file:
+        config['service_account_file'] = service_account_file
+
+
+# 原样复制到rclone配置中的可选字段
+_DRIVE_KEYS = ('client_id', 'client_secret', 'service_account_file')
+
+# 授权方式 -> 表单字段处理函数
+_AUTH_HANDLERS = {
+    'oauth': _fill_oauth,
+    'service_account': _fill_service_account,
+}
+
+
 class GoogleDriveStorageType(BaseStorageType):
     """Google Drive 存储类型"""
-    
-    def get_type_id(self) -> str:
-        return "google_drive"
-    
-    def get_display_name(self) -> str:
-        return "Google Drive"
-    
-    def get_template_name(self) -> str:
-        return "storage_types/google_drive_config.html"
-    
-    def get_required_fields(self) -> list:
-        return []  # Google Drive可以使用默认OAuth配置
-    
-    def get_icon_class(self) -> str:
-        return "bi bi-google"
-    
-    def get_icon_color(self) -> str:
-        return "#4285f4"
-    
-    def get_description(self) -> str:
-        return "Google Drive 云存储服务，支持OAuth2授权"
+
+    __slots__ = ()
+
+    TYPE_ID = "google_drive"
+    DISPLAY_NAME = "Google Drive"
+    TEMPLATE_NAME = "storage_types/google_drive_config.html"
+    REQUIRED_FIELDS = ()  # Google Drive可以使用默认OAuth配置
+    ICON_CLASS = "bi bi-google"
+    ICON_COLOR = "#4285f4"
+    DESCRIPTION = "Google Drive 云存储服务，支持OAuth2授权"
     
     def process_form_data(self, form_data: dict) -> dict:
         """处理Google Drive表单数据"""
@@ -40,21 +57,9 @@ class GoogleDriveStorageType(BaseStorageType):
         auth_type = form_data.get('drive_auth_type', 'oauth')
         config['auth_type'] = auth_type
         
-        if auth_type == 'oauth':
-            # OAuth2配置
-            client_id = form_data.get('client_id', '').strip()
-            if client_id:
-                config['client_id'] = client_id
-            
-            client_secret = form_data.get('client_secret', '').strip()
-            if client_secret:
-                config['client_secret'] = client_secret
-        
-        elif auth_type == 'service_account':
-            # 服务账户配置
-            service_account_file = form_data.get('service_account_file', '').strip()
-            if service_account_file:
-                config['service_account_file'] = service_account_file
+        handler = _AUTH_HANDLERS.get(auth_type)
+        if handler:
+            handler(form_data, config)
         
         # 其他可选配置
         scope = form_data.get('scope', 'drive')
@@ -77,24 +82,12 @@ class GoogleDriveStorageType(BaseStorageType):
     
     def get_rclone_config(self, config_data: dict) -> dict:
         """生成Google Drive的rclone配置"""
-        rclone_config = {
-            'type': 'drive'
-        }
-        
-        # 客户端配置
-        if 'client_id' in config_data:
-            rclone_config['client_id'] = config_data['client_id']
-        
-        if 'client_secret' in config_data:
-            rclone_config['client_secret'] = config_data['client_secret']
-        
-        # 服务账户配置
-        if 'service_account_file' in config_data:
-            rclone_config['service_account_file'] = config_data['service_account_file']
+        # 客户端配置和服务账户配置
+        rclone_config = {'type': 'drive'}
+        rclone_config.update({key: config_data[key] for key in _DRIVE_KEYS if key in config_data})
         
         # 权限范围
-        scope = config_data.get('scope', 'drive')
-        rclone_config['scope'] = scope
+        rclone_config['scope'] = config_data.get('scope', 'drive')
         
         return rclone_config
     
@@ -11,32 +11,20 @@ from ..builders import S3CompatibleBuilder
 
 class MinIOStorageType(BaseStorageType):
     """MinIO 存储类型 - 使用构造器模式的示例"""
-    
-    def __init__(self):
-        # 使用S3兼容构造器，因为MinIO兼容S3 API
-        self.builder = (S3CompatibleBuilder('MinIO')
-                       .set_endpoint_required(True))  # MinIO需要指定端点
-    
-    def get_type_id(self) -> str:
-        return "minio"
-    
-    def get_display_name(self) -> str:
-        return "MinIO"
-    
-    def get_template_name(self) -> str:
-        return "storage_types/minio_config.html"
-    
-    def get_required_fields(self) -> list:
-        return ["access_key", "secret_key", "endpoint"]
-    
-    def get_icon_class(self) -> str:
-        return "bi bi-hdd-stack"
-    
-    def get_icon_color(self) -> str:
-        return "#c72e29"
-    
-    def get_description(self) -> str:
-        return "MinIO 高性能对象存储，兼容Amazon S3 API"
+
+    __slots__ = ()
+
+    TYPE_ID = "minio"
+    DISPLAY_NAME = "MinIO"
+    TEMPLATE_NAME = "storage_types/minio_config.html"
+    REQUIRED_FIELDS = ("access_key", "secret_key", "endpoint")
+    ICON_CLASS = "bi bi-hdd-stack"
+    ICON_COLOR = "#c72e29"
+    DESCRIPTION = "MinIO 高性能对象存储，兼容Amazon S3 API"
+    
+    # 使用S3兼容构造器，因为MinIO兼容S3 API；构造器不保存表单数据，所有实例共用一个
+    builder = (S3CompatibleBuilder('MinIO')
+               .set_endpoint_required(True))  # MinIO需要指定端点
     
     def process_form_data(self, form_data: dict) -> dict:
         """处理MinIO表单数据 - 使用构造器"""
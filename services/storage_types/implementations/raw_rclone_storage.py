@@ -6,33 +6,24 @@
 
 from typing import Dict, Tuple
 from ..base import BaseStorageType
-import configparser
-import io
+import re
+
+# INI格式判断：跳过开头的空白和注释行后，第一行是 [section] 段头
+_INI_START_RE = re.compile(r'\s*(?:[#;][^\n]*(?:\n\s*|$))*\[')
 
 
 class RawRcloneStorageType(BaseStorageType):
     """原始rclone配置存储类型"""
-    
-    def get_type_id(self) -> str:
-        return "raw_rclone"
-    
-    def get_display_name(self) -> str:
-        return "原始rclone配置"
-    
-    def get_template_name(self) -> str:
-        return "storage_types/raw_rclone_config.html"
-    
-    def get_required_fields(self) -> list:
-        return ["rclone_config"]
-    
-    def get_icon_class(self) -> str:
-        return "bi bi-code-square"
-    
-    def get_icon_color(self) -> str:
-        return "#6f42c1"
-    
-    def get_description(self) -> str:
-        return "直接编写rclone配置，支持所有rclone支持的存储类型"
+
+    __slots__ = ()
+
+    TYPE_ID = "raw_rclone"
+    DISPLAY_NAME = "原始rclone配置"
+    TEMPLATE_NAME = "storage_types/raw_rclone_config.html"
+    REQUIRED_FIELDS = ("rclone_config",)
+    ICON_CLASS = "bi bi-code-square"
+    ICON_COLOR = "#6f42c1"
+    DESCRIPTION = "直接编写rclone配置，支持所有rclone支持的存储类型"
     
     def process_form_data(self, form_data: dict) -> dict:
         """处理原始rclone配置数据"""
@@ -92,9 +83,11 @@ class RawRcloneStorageType(BaseStorageType):
         # 1. key=value 格式
         # 2. INI格式（如果包含[section]）
         
-        if '[' in raw_config and ']' in raw_config:
-            # INI格式
-            config_parser = configparser.ConfigParser()
+        if _INI_START_RE.match(raw_config):
+            # INI格式（rclone配置不使用 %(name)s 插值，无需插值处理）
+            # 只有INI格式的输入才需要configparser，延迟到这里导入
+            import configparser
+            config_parser = configparser.RawConfigParser(interpolation=None)
             config_parser.read_string(raw_config)
             
             # 假设用户只配置了一个section，取第一个非DEFAULT section
@@ -113,11 +106,10 @@ class RawRcloneStorageType(BaseStorageType):
                 if not line or line.startswith('#'):
                     continue
                 
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    config[key.strip()] = value.strip()
-                else:
+                key, sep, value = line.partition('=')
+                if not sep:
                     raise ValueError(f"配置行格式错误: {line}")
+                config[key.strip()] = value.strip()
         
         return config
     
@@ -11,30 +11,19 @@ from ..builders import S3CompatibleBuilder
 
 class S3StorageType(BaseStorageType):
     """Amazon S3 存储类型"""
-    
-    def __init__(self):
-        self.builder = S3CompatibleBuilder.create_aws_s3()
-    
-    def get_type_id(self) -> str:
-        return "s3"
-    
-    def get_display_name(self) -> str:
-        return "Amazon S3"
-    
-    def get_template_name(self) -> str:
-        return "storage_types/s3_config.html"
-    
-    def get_required_fields(self) -> list:
-        return ["access_key", "secret_key"]
-    
-    def get_icon_class(self) -> str:
-        return "bi bi-amazon"
-    
-    def get_icon_color(self) -> str:
-        return "#ff9900"
-    
-    def get_description(self) -> str:
-        return "Amazon S3 对象存储服务，支持S3兼容的存储服务"
+
+    __slots__ = ()
+
+    TYPE_ID = "s3"
+    DISPLAY_NAME = "Amazon S3"
+    TEMPLATE_NAME = "storage_types/s3_config.html"
+    REQUIRED_FIELDS = ("access_key", "secret_key")
+    ICON_CLASS = "bi bi-amazon"
+    ICON_COLOR = "#ff9900"
+    DESCRIPTION = "Amazon S3 对象存储服务，支持S3兼容的存储服务"
+    
+    # 构造器不保存表单数据，所有实例共用一个
+    builder = S3CompatibleBuilder.create_aws_s3()
     
     def process_form_data(self, form_data: dict) -> dict:
         """处理S3表单数据"""
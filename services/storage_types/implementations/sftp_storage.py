@@ -6,31 +6,21 @@ SFTP 存储类型实现
 
 from typing import Dict, Tuple
 from ..base import BaseStorageType
+from ..builders import RCLONE_TRUE
 
 
 class SFTPStorageType(BaseStorageType):
     """SFTP 存储类型"""
 
-    def get_type_id(self) -> str:
-        return "sftp"
+    __slots__ = ()
 
-    def get_display_name(self) -> str:
-        return "SFTP"
-
-    def get_template_name(self) -> str:
-        return "storage_types/sftp_config.html"
-
-    def get_required_fields(self) -> list:
-        return ["host", "username"]
-
-    def get_icon_class(self) -> str:
-        return "bi bi-server"
-
-    def get_icon_color(self) -> str:
-        return "#28a745"
-
-    def get_description(self) -> str:
-        return "SSH文件传输协议，安全的文件传输服务"
+    TYPE_ID = "sftp"
+    DISPLAY_NAME = "SFTP"
+    TEMPLATE_NAME = "storage_types/sftp_config.html"
+    REQUIRED_FIELDS = ("host", "username")
+    ICON_CLASS = "bi bi-server"
+    ICON_COLOR = "#28a745"
+    DESCRIPTION = "SSH文件传输协议，安全的文件传输服务"
 
     def process_form_data(self, form_data: dict) -> dict:
         """处理SFTP表单数据 - 直接转换为rclone配置格式"""
@@ -61,7 +51,7 @@ class SFTPStorageType(BaseStorageType):
 
         # SFTP特有选项
         if form_data.get('disable_hashcheck'):
-            config['disable_hashcheck'] = 'true'
+            config['disable_hashcheck'] = RCLONE_TRUE
 
         return config
 
@@ -77,6 +67,4 @@ class SFTPStorageType(BaseStorageType):
 
     def get_rclone_config(self, config_data: dict) -> dict:
         """生成SFTP的rclone配置"""
-        rclone_config = {'type': 'sftp'}
-        rclone_config.update(config_data)
-        return rclone_config
+        return {'type': 'sftp', **config_data}
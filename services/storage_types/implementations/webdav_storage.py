@@ -6,31 +6,21 @@ WebDAV 存储类型实现
 
 from typing import Dict, Tuple
 from ..base import BaseStorageType
+from ..builders import RCLONE_TRUE
 
 
 class WebDAVStorageType(BaseStorageType):
     """WebDAV 存储类型"""
 
-    def get_type_id(self) -> str:
-        return "webdav"
+    __slots__ = ()
 
-    def get_display_name(self) -> str:
-        return "WebDAV"
-
-    def get_template_name(self) -> str:
-        return "storage_types/webdav_config.html"
-
-    def get_required_fields(self) -> list:
-        return ["url", "username", "password"]
-
-    def get_icon_class(self) -> str:
-        return "bi bi-globe"
-
-    def get_icon_color(self) -> str:
-        return "#17a2b8"
-
-    def get_description(self) -> str:
-        return "WebDAV协议存储服务，支持多种云存储和NAS设备"
+    TYPE_ID = "webdav"
+    DISPLAY_NAME = "WebDAV"
+    TEMPLATE_NAME = "storage_types/webdav_config.html"
+    REQUIRED_FIELDS = ("url", "username", "password")
+    ICON_CLASS = "bi bi-globe"
+    ICON_COLOR = "#17a2b8"
+    DESCRIPTION = "WebDAV协议存储服务，支持多种云存储和NAS设备"
 
     def process_form_data(self, form_data: dict) -> dict:
         """处理WebDAV表单数据 - 直接映射字段"""
@@ -48,7 +38,7 @@ class WebDAVStorageType(BaseStorageType):
 
         # SSL设置
         if form_data.get('disable_ssl_verify'):
-            config['disable_ssl_verify'] = 'true'
+            config['disable_ssl_verify'] = RCLONE_TRUE
 
         return config
 
@@ -65,13 +55,11 @@ class WebDAVStorageType(BaseStorageType):
 
         # 验证URL格式
         url = config_data.get('url', '')
-        if not (url.startswith('http://') or url.startswith('https://')):
+        if not url.startswith(('http://', 'https://')):
             return False, "WebDAV URL 必须以 http:// 或 https:// 开头"
 
         return True, ""
 
     def get_rclone_config(self, config_data: dict) -> dict:
         """生成WebDAV的rclone配置"""
-        rclone_config = {'type': 'webdav'}
-        rclone_config.update(config_data)
-        return rclone_config
+        return {'type': 'webdav', **config_data}
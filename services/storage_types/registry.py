@@ -4,7 +4,8 @@
 提供存储类型的注册、查找和管理功能
 """
 
-from typing import Dict, List, Optional
+import sys
+from typing import Callable, Dict, ItemsView, List, Optional, Tuple
 from .base import BaseStorageType
 
 
@@ -12,6 +13,20 @@ class StorageTypeRegistry:
     """存储类型注册器"""
     
     _storage_types: Dict[str, BaseStorageType] = {}
+
+    # 注册时预先绑定的方法表，分派时只需一次字典查找
+    _process: Dict[str, Callable[[dict], dict]] = {}
+    _validate: Dict[str, Callable[[dict], tuple]] = {}
+    _rclone: Dict[str, Callable[[dict], dict]] = {}
+    _templates: Dict[str, str] = {}
+
+    # get_all_types / list_registered_types 的结果缓存，注册新类型时失效
+    _all_types_cache: Optional[List[Dict[str, str]]] = None
+    _compact_types_cache: Optional[Tuple[Tuple[str, str], ...]] = None
+    _type_ids_cache: Optional[List[str]] = None
+
+    # 注册版本号，每次注册时递增，供外部缓存判断注册的类型是否变化
+    _version: int = 0
     
     @classmethod
     def register(cls, storage_type: BaseStorageType) -> None:
@@ -19,52 +34,83 @@ class StorageTypeRegistry:
         if not isinstance(storage_type, BaseStorageType):
             raise TypeError("存储类型必须继承自 BaseStorageType")
         
-        cls._storage_types[storage_type.get_type_id()] = storage_type
+        type_id = storage_type.get_type_id()
+        if not type_id:
+            raise TypeError(f"存储类型 {type(storage_type).__name__} 未声明 TYPE_ID")
+        cls._storage_types[type_id] = storage_type
+        cls._process[type_id] = storage_type.process_form_data
+        cls._validate[type_id] = storage_type.validate_config
+        cls._rclone[type_id] = storage_type.get_rclone_config
+        cls._templates[type_id] = storage_type.get_template_name()
+        cls._all_types_cache = None
+        cls._compact_types_cache = None
+        cls._type_ids_cache = None
+        cls._version += 1
     
     @classmethod
     def get_type(cls, type_id: str) -> Optional[BaseStorageType]:
         """获取指定的存储类型"""
         return cls._storage_types.get(type_id)
     
+    @classmethod
+    def version(cls) -> int:
+        """获取注册版本号，注册新类型（或重新注册）后变化"""
+        return cls._version
+
+    @classmethod
+    def items(cls) -> ItemsView[str, BaseStorageType]:
+        """遍历所有注册的 (类型ID, 存储类型实例)，调用方不应修改"""
+        return cls._storage_types.items()
+
+    @classmethod
+    def get_all_types_compact(cls) -> Tuple[Tuple[str, str], ...]:
+        """获取所有注册的存储类型的 (value, label) 元组（缓存）"""
+        if cls._compact_types_cache is None:
+            cls._compact_types_cache = tuple(
+                (type_id, sys.intern(storage_type.get_display_name()))
+                for type_id, storage_type in cls._storage_types.items()
+            )
+        return cls._compact_types_cache
+
     @classmethod
     def get_all_types(cls) -> List[Dict[str, str]]:
-        """获取所有注册的存储类型"""
-        return [
-            {
-                'value': type_id,
-                'label': storage_type.get_display_name()
-            }
-            for type_id, storage_type in cls._storage_types.items()
-        ]
+        """获取所有注册的存储类型（缓存的列表，调用方不应修改）"""
+        if cls._all_types_cache is None:
+            cls._all_types_cache = [
+                {'value': value, 'label': label}
+                for value, label in cls.get_all_types_compact()
+            ]
+        return cls._all_types_cache
     
     @classmethod
     def get_template_name(cls, type_id: str) -> Optional[str]:
         """获取存储类型的模板名称"""
-        storage_type = cls.get_type(type_id)
-        return storage_type.get_template_name() if storage_type else None
+        return cls._templates.get(type_id)
     
     @classmethod
     def process_form_data(cls, type_id: str, form_data: dict) -> Optional[dict]:
         """处理表单数据"""
-        storage_type = cls.get_type(type_id)
-        return storage_type.process_form_data(form_data) if storage_type else None
+        process = cls._process.get(type_id)
+        return process(form_data) if process else None
     
     @classmethod
     def validate_config(cls, type_id: str, config_data: dict) -> tuple[bool, str]:
         """验证配置数据"""
-        storage_type = cls.get_type(type_id)
-        if not storage_type:
+        validate = cls._validate.get(type_id)
+        if not validate:
             return False, f"未知的存储类型: {type_id}"
         
-        return storage_type.validate_config(config_data)
+        return validate(config_data)
     
     @classmethod
     def get_rclone_config(cls, type_id: str, config_data: dict) -> Optional[dict]:
         """获取rclone配置"""
-        storage_type = cls.get_type(type_id)
-        return storage_type.get_rclone_config(config_data) if storage_type else None
+        get_config = cls._rclone.get(type_id)
+        return get_config(config_data) if get_config else None
     
     @classmethod
     def list_registered_types(cls) -> List[str]:
-        """列出所有已注册的存储类型ID"""
-        return list(cls._storage_types.keys())
+        """列出所有已注册的存储类型ID（缓存的列表，调用方不应修改）"""
+        if cls._type_ids_cache is None:
+            cls._type_ids_cache = list(cls._storage_types)
+        return cls._type_ids_cache
@@ -5,50 +5,143 @@
 """
 
 import os
+from types import MappingProxyType
 from flask import current_app
 from .storage_types import StorageTypeRegistry
 
 
 class TemplateLoader:
     """模板加载器"""
+
+    # 模板文件内容缓存：模板路径 -> (修改时间, 内容)
+    _cache = {}
+
+    # 只读的存储类型信息缓存，以及构建时的注册版本号（注册的类型变化后缓存随之失效）
+    _info_cache = None
+    _info_version = None
+
+    @staticmethod
+    def _scan_directory(directory: str) -> dict:
+        """一次列出目录下的所有文件：文件路径 -> DirEntry"""
+        try:
+            with os.scandir(directory) as it:
+                return {entry.path: entry for entry in it if entry.is_file()}
+        except FileNotFoundError:
+            return {}
+
+    @classmethod
+    def _read_template(cls, entry: os.DirEntry) -> str:
+        """读取模板文件内容，修改时间未变的文件直接使用缓存"""
+        mtime = entry.stat().st_mtime
+        cached = cls._cache.get(entry.path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # 以二进制无缓冲方式一次读入后整体解码，再统一换行符（与文本模式一致，避免CRLF模板带入\r）
+        with open(entry.path, 'rb', buffering=0) as f:
+            content = f.read().decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        cls._cache[entry.path] = (mtime, content)
+        return content
+    
+    @classmethod
+    def _template_reader(cls):
+        """创建一次调用内使用的模板读取函数，各模板共享目录扫描结果"""
+        template_folder = current_app.template_folder
+        logger = current_app.logger
+        # 未开启模板自动重载时，已缓存的模板不再访问文件系统
+        check_files = current_app.jinja_env.auto_reload
+        # 模板所在目录按需各扫描一次，代替逐个文件的打开和stat
+        entries = {}
+        scanned_dirs = set()
+
+        def load(type_id: str, storage_type) -> str:
+            template_path = os.path.join(template_folder, storage_type.get_template_name())
+
+            cached = cls._cache.get(template_path)
+            if cached is not None and not check_files:
+                return cached[1]
+
+            directory = os.path.dirname(template_path)
+            if directory not in scanned_dirs:
+                entries.update(cls._scan_directory(directory))
+                scanned_dirs.add(directory)
+
+            entry = entries.get(template_path)
+            if entry is None:
+                logger.warning(f"Template not found: {template_path}")
+                return f"<!-- Template not found for {type_id} -->"
+
+            try:
+                return cls._read_template(entry)
+            except Exception as e:
+                logger.error(f"Error loading template {template_path}: {e}")
+                return f"<!-- Error loading template for {type_id} -->"
+
+        return load
+
+    @staticmethod
+    def _type_info(storage_type) -> MappingProxyType:
+        """单个存储类型的展示信息（只读）"""
+        return MappingProxyType({
+            'display_name': storage_type.get_display_name(),
+            'icon_class': storage_type.get_icon_class(),
+            'icon_color': storage_type.get_icon_color(),
+            'description': storage_type.get_description(),
+            'required_fields': storage_type.get_required_fields()
+        })
+
+    @classmethod
+    def _cached_info(cls):
+        """注册的类型未变化时返回缓存的存储类型信息，否则返回None"""
+        if cls._info_version == StorageTypeRegistry.version():
+            return cls._info_cache
+        return None
+
+    @classmethod
+    def _store_info(cls, info: dict, version: int) -> MappingProxyType:
+        """冻结并缓存存储类型信息"""
+        cls._info_cache = MappingProxyType(info)
+        cls._info_version = version
+        return cls._info_cache
     
     @staticmethod
     def get_storage_config_templates():
         """获取所有存储类型的配置模板内容"""
         templates = {}
+        load = TemplateLoader._template_reader()
         
-        for type_id in StorageTypeRegistry.list_registered_types():
-            storage_type = StorageTypeRegistry.get_type(type_id)
-            if storage_type:
-                template_name = storage_type.get_template_name()
-                template_path = os.path.join(current_app.template_folder, template_name)
-                
-                try:
-                    with open(template_path, 'r', encoding='utf-8') as f:
-                        templates[type_id] = f.read()
-                except FileNotFoundError:
-                    current_app.logger.warning(f"Template not found: {template_path}")
-                    templates[type_id] = f"<!-- Template not found for {type_id} -->"
-                except Exception as e:
-                    current_app.logger.error(f"Error loading template {template_path}: {e}")
-                    templates[type_id] = f"<!-- Error loading template for {type_id} -->"
+        for type_id, storage_type in StorageTypeRegistry.items():
+            templates[type_id] = load(type_id, storage_type)
         
         return templates
     
-    @staticmethod
-    def get_storage_type_info():
-        """获取所有存储类型的信息"""
-        info = {}
-        
-        for type_id in StorageTypeRegistry.list_registered_types():
-            storage_type = StorageTypeRegistry.get_type(type_id)
-            if storage_type:
-                info[type_id] = {
-                    'display_name': storage_type.get_display_name(),
-                    'icon_class': storage_type.get_icon_class(),
-                    'icon_color': storage_type.get_icon_color(),
-                    'description': storage_type.get_description(),
-                    'required_fields': storage_type.get_required_fields()
-                }
-        
+    @classmethod
+    def get_storage_type_info(cls) -> MappingProxyType:
+        """获取所有存储类型的信息（只读映射，注册的类型不变时直接返回缓存）"""
+        info = cls._cached_info()
+        if info is None:
+            version = StorageTypeRegistry.version()
+            info = cls._store_info({
+                type_id: cls._type_info(storage_type)
+                for type_id, storage_type in StorageTypeRegistry.items()
+            }, version)
         return info
+
+    @classmethod
+    def get_all(cls):
+        """一次遍历注册器，同时获取所有存储类型的配置模板内容和信息（信息已缓存时直接复用）"""
+        templates = {}
+        load = cls._template_reader()
+        version = StorageTypeRegistry.version()
+        info = cls._cached_info()
+        new_info = {} if info is None else None
+
+        for type_id, storage_type in StorageTypeRegistry.items():
+            templates[type_id] = load(type_id, storage_type)
+            if new_info is not None:
+                new_info[type_id] = cls._type_info(storage_type)
+
+        if new_info is not None:
+            info = cls._store_info(new_info, version)
+
+        return {'templates': templates, 'info': info}